@@ -25,7 +25,7 @@ def main():
     """
     # Ensure the source path exists
     if not os.path.exists(DEFAULT_PARAMS["source_path"]):
-        logger.error(f"Source path {DEFAULT_PARAMS['source_path']} does not exist.")
+        logger.error("Source path %s does not exist.", DEFAULT_PARAMS["source_path"])
         return
 
     try:
@@ -35,28 +35,20 @@ def main():
         # Load data
         data = get_data(**DEFAULT_PARAMS)
 
-        # Check the format and unpack data if necessary
-        if DEFAULT_PARAMS["split_ratio"] is not None:
-            if DEFAULT_PARAMS["return_format"] == "nested_list":
-                x_train, x_test, y_train, y_test = data
-            else:
-                x_train, x_test, y_train, y_test = data
-        else:
-            if DEFAULT_PARAMS["return_format"] == "nested_list":
-                x_data, y_data = data
-            else:
-                x_data, y_data = data
-
-        # Log some information about the loaded data
+        # Unpack the data (the return format does not change the number of values)
         if DEFAULT_PARAMS["split_ratio"] is not None:
+            x_train, x_test, y_train, y_test = data
             logger.info(
-                f"Loaded {len(x_train)} training samples and {len(x_test)} test samples."
+                "Loaded %d training samples and %d test samples.",
+                len(x_train),
+                len(x_test),
             )
         else:
-            logger.info(f"Loaded {len(x_data)} samples.")
+            x_data, y_data = data
+            logger.info("Loaded %d samples.", len(x_data))
 
     except Exception as e:
-        logger.error(f"An error occurred: {e}", exc_info=True)
+        logger.error("An error occurred: %s", e, exc_info=True)
 
 
 if __name__ == "__main__":
@@ -1,10 +1,12 @@
 from abc import ABC, abstractmethod
+from collections import Counter, defaultdict
+from concurrent.futures import ThreadPoolExecutor
 from tqdm import tqdm
-from numpy import nan, nanmean, nanvar
-from typing import List, Union, Dict
-
-from json.screw_run import ScrewRun
+import numpy as np
+from typing import List, Union, Dict, Tuple
 
+from screw_data_loading.json.get_dicts_from_json import DEFAULT_NUM_WORKERS
+from screw_data_loading.json.screw_run import ScrewRun
 
 # TODO:
 # Implement ID list/dict based import by scenario numbers
@@ -39,24 +41,31 @@ class AbstractConnection(ABC):
             Total count of runs.
         counts_of_dmc (Dict[str, int]):
             Counts of individual DMCs.
-        labels_of_dmc (Dict[str, List[str]]):
-            Lists of labels ("OK" vs. "NOK") for each DMC.
-        ids_of_dmc (Dict[str, List[str]]):
-            Lists of IDs for each DMC.
+        labels_of_dmc (Dict[str, np.ndarray]):
+            Arrays of labels ("OK" vs. "NOK") for each DMC (views into dmc_runs).
+        ids_of_dmc (Dict[str, np.ndarray]):
+            Arrays of IDs for each DMC (views into dmc_runs).
+        dmc_runs (np.ndarray):
+            Structured array with the fields "code", "label" and "id" of all runs,
+            grouped by DMC.
         num_of_runs (int):
             Total number of runs processed.
         num_of_dmcs (int):
             Total number of unique DMCs processed.
+        num_workers (int):
+            Number of threads used to load the screw runs concurrently.
 
     The class supports methods for loading and processing data, including updating metrics,
     retrieving data series for analysis, and aggregating statistics. It serves as a base for
     creating specific data loaders tailored to different data sources and formats.
     """
 
-    def __init__(self) -> None:
+    def __init__(self, num_workers: int = None) -> None:
         """
         Initializie the DataLoader.
         """
+        # Number of threads to load the screw runs (defaults to DEFAULT_NUM_WORKERS)
+        self.num_workers: int = num_workers or DEFAULT_NUM_WORKERS
         # List of all ids of the screw runs (e.g. ["Ch_300...json", Ch_300...json", ...])
         self.all_run_ids: List[str] = []
         # List of all screw runs, loaded from as ScrewRun objects by their run id from raw data
@@ -66,11 +75,17 @@ class AbstractConnection(ABC):
         self.count_of_nok: int = 0
         self.count_of_all: int = 0
         # Dicts to track the data matrix codes (DMC) in the data set
-        self.counts_of_dmc: dict = {}  # Counts of individual DMCs
-        self.labels_of_dmc: Dict[List] = {}  # Lists of their label ("OK" vs. "NOK")
-        self.ids_of_dmc: Dict[List] = (
-            {}
-        )  # List of their IDs (aka file names, e.g. "Ch_000...json")
+        self.counts_of_dmc: Dict[str, int] = {}  # Counts of individual DMCs
+        # Arrays of their label ("OK" vs. "NOK"), views into dmc_runs (see _freeze_dmcs)
+        self.labels_of_dmc: Dict[str, np.ndarray] = {}
+        # Arrays of their IDs (aka file names, e.g. "Ch_000...json"), views into dmc_runs
+        self.ids_of_dmc: Dict[str, np.ndarray] = {}
+        # Structured array of the DMC, label and ID of all runs (grouped by DMC)
+        self.dmc_runs: np.ndarray = np.empty(
+            0, dtype=[("code", str), ("label", str), ("id", str)]
+        )
+        # Slices of the runs of each DMC in dmc_runs
+        self._dmc_slices: Dict[str, slice] = {}
         # Counter variables to track the number of runs and individual DMCs
         self.num_of_runs: int = 0
         self.num_of_dmcs: int = 0
@@ -92,48 +107,139 @@ class AbstractConnection(ABC):
         self.update()
 
     def load_runs_from_ids(self):
-        self.all_runs = [
-            ScrewRun(name=run_id)
-            for run_id in tqdm(self.all_run_ids, desc="Loading screw run data")
-        ]
+        # Overlap the blocking file reads of the runs with a thread pool
+        with ThreadPoolExecutor(self.num_workers) as executor:
+            self.all_runs = list(
+                tqdm(
+                    executor.map(
+                        lambda run_id: ScrewRun(name=run_id), self.all_run_ids
+                    ),
+                    total=len(self.all_run_ids),
+                    desc="Loading screw run data",
+                )
+            )
 
     def update(self) -> None:
         """
-        Collection of methods to update all additional metrics of the screw run.
+        Update all additional metrics of the screw run in a single pass over all runs.
         """
+        label_counts, dmc_dicts = self._collect_runs()
         # Update the label counts
-        self.update_label_counts()
+        self._set_label_counts(label_counts)
         # Update the data matrix code dictionaries
-        self.update_dmc_dics()
+        self._set_dmc_dics(*dmc_dicts)
         # Update the number of runs
         self.update_num_of_runs()
         # Update the number of DMCs
         self.update_num_of_dmcs()
 
     def update_label_counts(self) -> None:
+        """
+        Update the counts of "OK" and "NOK" runs (recounted from all runs).
+
+        `update` updates these together with all other metrics in a single pass.
+        """
+        self._set_label_counts(self._collect_runs()[0])
+
+    def update_dmc_dics(self) -> None:
+        """
+        Update the counts, labels and IDs of the DMCs (recollected from all runs).
+
+        `update` updates these together with all other metrics in a single pass.
+        """
+        self._set_dmc_dics(*self._collect_runs()[1])
+
+    def _collect_runs(
+        self,
+    ) -> Tuple[Counter, Tuple[Counter, Dict[str, List[str]], Dict[str, List[str]]]]:
+        """
+        Collect the labels and DMCs of all runs in a single pass.
+
+        Returns:
+            Tuple[Counter, Tuple[Counter, Dict[str, List[str]], Dict[str, List[str]]]]
+                The counts of the labels, and the counts, labels and IDs by DMC.
+        """
+        label_counts = Counter()
+        counts_of_dmc = Counter()
+        labels_of_dmc = defaultdict(list)
+        ids_of_dmc = defaultdict(list)
+
         for screw_run in self.all_runs:
+            result, code, name = screw_run.result, screw_run.code, screw_run.name
             # Update the count of "OK" and "NOK" screw runs
-            if screw_run.result == "OK":
-                self.count_of_ok += 1
-            elif screw_run.result == "NOK":
-                self.count_of_nok += 1
-            else:
-                raise ValueError(
-                    f"Unkown label {screw_run.result} in screw run {screw_run.name}"
-                )
+            if result != "OK" and result != "NOK":
+                raise ValueError(f"Unkown label {result} in screw run {name}")
+            label_counts[result] += 1
+            # Update the dmc dictionaries for each screw run (append in place, since
+            # `+= [value]` would allocate a throwaway list for every run)
+            counts_of_dmc[code] += 1
+            labels_of_dmc[code].append(result)
+            ids_of_dmc[code].append(name)
+        return label_counts, (counts_of_dmc, labels_of_dmc, ids_of_dmc)
+
+    def _set_label_counts(self, label_counts: Counter) -> None:
+        """Set the counts of "OK" and "NOK" runs (see `_collect_runs`)."""
+        self.count_of_ok = label_counts["OK"]
+        self.count_of_nok = label_counts["NOK"]
         self.count_of_all = self.count_of_ok + self.count_of_nok
 
-    def update_dmc_dics(self) -> None:
-        for screw_run in self.all_runs:
-            # Update the dmc dictionaries for each screw run
-            if screw_run.code not in self.counts_of_dmc.keys():
-                self.counts_of_dmc[screw_run.code] = 1
-                self.labels_of_dmc[screw_run.code] = [screw_run.result]
-                self.ids_of_dmc[screw_run.code] = [screw_run.name]
-            else:
-                self.counts_of_dmc[screw_run.code] += 1
-                self.labels_of_dmc[screw_run.code] += [screw_run.result]
-                self.ids_of_dmc[screw_run.code] += [screw_run.name]
+    def _set_dmc_dics(
+        self,
+        counts_of_dmc: Counter,
+        labels_of_dmc: Dict[str, List[str]],
+        ids_of_dmc: Dict[str, List[str]],
+    ) -> None:
+        """Set the DMC dictionaries (see `_collect_runs`) as views into dmc_runs."""
+        self.counts_of_dmc = dict(counts_of_dmc)
+        self.labels_of_dmc = dict(labels_of_dmc)
+        self.ids_of_dmc = dict(ids_of_dmc)
+        # Store the labels and IDs of the DMCs in a structured array
+        self._freeze_dmcs()
+
+    def _freeze_dmcs(self) -> None:
+        """
+        Flatten the labels and IDs of all DMCs into the structured array dmc_runs.
+
+        The dicts labels_of_dmc and ids_of_dmc are replaced by views into the array, which
+        avoids storing a Python string object per run and allows vectorized statistics
+        (e.g. `np.count_nonzero(self.dmc_runs["label"] == "NOK")`).
+        """
+        codes = list(self.labels_of_dmc)
+        num_of_runs_by_dmc = [len(self.labels_of_dmc[code]) for code in codes]
+
+        # Flatten the dicts, so that the runs of each DMC are stored consecutively
+        flat_codes = np.repeat(np.array(codes, dtype=str), num_of_runs_by_dmc)
+        flat_labels = np.array(
+            [label for code in codes for label in self.labels_of_dmc[code]], dtype=str
+        )
+        flat_ids = np.array(
+            [run_id for code in codes for run_id in self.ids_of_dmc[code]], dtype=str
+        )
+        self.dmc_runs = np.empty(
+            len(flat_codes),
+            dtype=[
+                ("code", flat_codes.dtype),
+                ("label", flat_labels.dtype),
+                ("id", flat_ids.dtype),
+            ],
+        )
+        self.dmc_runs["code"] = flat_codes
+        self.dmc_runs["label"] = flat_labels
+        self.dmc_runs["id"] = flat_ids
+
+        # Get the slice of each DMC to replace the dicts with views into the array
+        stops = np.cumsum(num_of_runs_by_dmc, dtype=np.int64)
+        starts = stops - num_of_runs_by_dmc
+        self._dmc_slices = {
+            code: slice(int(start), int(stop))
+            for code, start, stop in zip(codes, starts, stops)
+        }
+        self.labels_of_dmc = {
+            code: self.dmc_runs["label"][s] for code, s in self._dmc_slices.items()
+        }
+        self.ids_of_dmc = {
+            code: self.dmc_runs["id"][s] for code, s in self._dmc_slices.items()
+        }
 
     def update_num_of_runs(self) -> None:
         """
@@ -141,14 +247,12 @@ class AbstractConnection(ABC):
         """
         num_of_run_ids = len(self.all_run_ids)
         num_of_runs = len(self.all_runs)
-        try:
-            # Double check the lengths to avoid missing runs
-            assert num_of_run_ids == num_of_runs
-            self.num_of_runs = num_of_runs
-        except AssertionError:
-            raise AssertionError(
+        # Double check the lengths to avoid missing runs (explicit check survives -O)
+        if num_of_run_ids != num_of_runs:
+            raise ValueError(
                 f"The number of run ids {num_of_run_ids} does not match the number of runs {num_of_runs}"
             )
+        self.num_of_runs = num_of_runs
 
     def update_num_of_dmcs(self) -> None:
         """
@@ -156,26 +260,24 @@ class AbstractConnection(ABC):
         """
         num_of_dmcs = len(self.counts_of_dmc)
         num_of_dmcs_by_label = len(self.labels_of_dmc)
-        try:
-            # Double check the lengths to avoid missing runs
-            assert num_of_dmcs == num_of_dmcs_by_label
-            self.num_of_dmcs = num_of_dmcs
-        except AssertionError:
-            raise AssertionError(
+        # Double check the lengths to avoid missing runs (explicit check survives -O)
+        if num_of_dmcs != num_of_dmcs_by_label:
+            raise ValueError(
                 f"The number of dmc labels {num_of_dmcs_by_label} does not match the number of dmcs by count {num_of_dmcs}"
             )
+        self.num_of_dmcs = num_of_dmcs
 
-    def get_time_values(self) -> List[List[float]]:
-        return [run.time_values for run in self.all_runs]
+    def get_time_values(self) -> List[np.ndarray]:
+        return [run.get_run_values("time values") for run in self.all_runs]
 
-    def get_angle_values(self) -> List[List[float]]:
-        return [run.angle_values for run in self.all_runs]
+    def get_angle_values(self) -> List[np.ndarray]:
+        return [run.get_run_values("angle values") for run in self.all_runs]
 
-    def get_torque_values(self) -> List[List[float]]:
-        return [run.torque_values for run in self.all_runs]
+    def get_torque_values(self) -> List[np.ndarray]:
+        return [run.get_run_values("torque values") for run in self.all_runs]
 
-    def get_gradient_values(self) -> List[List[float]]:
-        return [run.gradient_values for run in self.all_runs]
+    def get_gradient_values(self) -> List[np.ndarray]:
+        return [run.get_run_values("gradient values") for run in self.all_runs]
 
     def get_run_ids(self) -> List[str]:
         """
@@ -197,6 +299,26 @@ class AbstractConnection(ABC):
         """
         return self.all_runs
 
+    def get_labels_of_dmc(self, code: str) -> np.ndarray:
+        """
+        Get the labels of all runs of a DMC (e.g. "OK" or "NOK").
+
+        Returns:
+            np.ndarray
+                The labels of the runs with the DMC, in the order they were loaded.
+        """
+        return self.dmc_runs["label"][self._dmc_slices[code]]
+
+    def get_ids_of_dmc(self, code: str) -> np.ndarray:
+        """
+        Get the IDs of all runs of a DMC.
+
+        Returns:
+            np.ndarray
+                The IDs of the runs with the DMC, in the order they were loaded.
+        """
+        return self.dmc_runs["id"][self._dmc_slices[code]]
+
     def get_run_results(self) -> List[str]:
         """
         Get the labels of the screw data (e.g. "OK" or "NOK").
@@ -207,16 +329,19 @@ class AbstractConnection(ABC):
         """
         return [run.result for run in self.all_runs]
 
-    def aggregate_all_series(self, list_of_series: List[List[float]]) -> List[float]:
+    def aggregate_all_series(
+        self, list_of_series: List[np.ndarray]
+    ) -> Tuple[np.ndarray, np.ndarray]:
         # Find the length of the longest time series
         max_len = max(map(len, list_of_series))
 
-        # Pad all time series with NaN values to make them equal length
-        padded_list_of_series = [
-            series + [nan] * (max_len - len(series)) for series in list_of_series
-        ]
+        # Copy all time series into one buffer, padded with NaN values to equal length
+        padded_series = np.full((len(list_of_series), max_len), np.nan, np.float32)
+        for i, series in enumerate(list_of_series):
+            padded_series[i, : len(series)] = series
 
-        # Calculate  and return the mean for each time point, ignoring NaN values
-        return nanmean(padded_list_of_series, axis=0), nanvar(
-            padded_list_of_series, axis=0
-        )
+        # Calculate the mean and variance for each time point, ignoring NaN values
+        counts = np.count_nonzero(~np.isnan(padded_series), axis=0)
+        means = np.nansum(padded_series, axis=0) / counts
+        variances = np.nansum((padded_series - means) ** 2, axis=0) / counts
+        return means, variances
@@ -1,11 +1,22 @@
 # default
 import os
+from concurrent.futures import ThreadPoolExecutor
 from tqdm import tqdm
-from typing import Union, List, Any
+from typing import Union, List, Any, Dict, Tuple
+
+import numpy as np
 
 # Project
 from screw_data_loading.connect.abstract import AbstractConnection
+from screw_data_loading.json.get_dicts_from_json import (
+    DEFAULT_NUM_WORKERS,
+    get_dicts_from_json,
+)
 from screw_data_loading.json.screw_run import ScrewRun
+from screw_data_loading.logs import get_logger
+
+# Configure logging
+logger = get_logger(__name__)
 
 
 class JsonConnection(AbstractConnection):
@@ -19,7 +30,12 @@ class JsonConnection(AbstractConnection):
     and various counters and dictionaries for managing and analyzing the data.
     """
 
-    def __init__(self, path: Union[str, List[str]]) -> None:
+    def __init__(
+        self,
+        path: Union[str, List[str]],
+        num_workers: int = None,
+        cache_enabled: bool = True,
+    ) -> None:
         """
         Initializes the DataFromJSON loader with a path or paths to JSON files, loads run IDs,
         and then loads the screw runs based on those IDs, updating the loader's internal state.
@@ -27,12 +43,21 @@ class JsonConnection(AbstractConnection):
         Args:
             path: A single path (str) or a list of paths (List[str]) pointing to the directories
                   containing the screw run JSON files to be loaded.
+            num_workers: Number of threads used to load the screw runs concurrently.
+            cache_enabled: Whether to cache the decoded JSON files in memory, so that
+                  loading the same unchanged files again skips decoding them.
 
         Raises:
             ValueError: If the provided path argument is neither a string nor a list of strings.
         """
         # Initialize the base class
-        super().__init__()
+        super().__init__(num_workers=num_workers)
+        # Whether the decoded JSON files are cached (see get_dict_from_json)
+        self.cache_enabled: bool = cache_enabled
+        # List of the directories of all screw runs (in the order of all_run_ids)
+        self.all_run_paths: List[str] = []
+        # Cache of the JSON file names by directory (to scan each directory only once)
+        self._dir_cache: Dict[str, List[str]] = {}
         # Load run IDs from the specified path(s)
         self.load_run_ids(path=path)
         # Load screw runs based on IDs and update loader state
@@ -73,8 +98,49 @@ class JsonConnection(AbstractConnection):
                 )
 
             # Get all json files from the current path and append to the list
-            current_runs = [f for f in os.listdir(current_path) if f.endswith(".json")]
+            current_runs = self.list_json_files(current_path)
             self.all_run_ids.extend(current_runs)
+            self.all_run_paths.extend([current_path] * len(current_runs))
+
+    def list_json_files(self, path: str) -> List[str]:
+        """
+        List the names of all JSON files in a directory (cached per directory).
+
+        Parameters:
+        -----------
+        path : str
+            The directory to scan for JSON files.
+
+        Returns:
+        --------
+        List[str]
+            The names of the JSON files in the directory.
+        """
+        if path not in self._dir_cache:
+            # The entries of scandir carry the file type, so no extra stat is required
+            with os.scandir(path) as entries:
+                self._dir_cache[path] = [
+                    e.name for e in entries if e.is_file() and e.name.endswith(".json")
+                ]
+        return self._dir_cache[path]
+
+    def load_runs_from_ids(self) -> None:
+        """
+        Load the screw runs of all run IDs by reading their JSON files in one batch.
+        """
+        # Read and decode all JSON files concurrently
+        all_json_dicts = get_dicts_from_json(
+            self.all_run_paths, self.all_run_ids, self.num_workers, self.cache_enabled
+        )
+        # Construct the screw runs from the already decoded dicts
+        self.all_runs = [
+            ScrewRun(name=run_id, path=run_path, json_dict=json_dict)
+            for run_id, run_path, json_dict in tqdm(
+                zip(self.all_run_ids, self.all_run_paths, all_json_dicts),
+                total=len(self.all_run_ids),
+                desc="Loading screw run data",
+            )
+        ]
 
 
 class InvalidPathError(Exception):
@@ -95,6 +161,7 @@ def load_from_json(
     steps: Any,
     log: bool,
     verbose: bool,
+    num_workers: int = None,
 ):
     # Check if path from source is valid (backup check)
     if not os.path.isdir(source):
@@ -105,44 +172,66 @@ def load_from_json(
     # Check if `time values` is in values if make_equidistance is required
     #
 
-    # Create empty list to collect all screw runs
-    list_of_all_screw_runs = []
-    # Create empty dict for cycle count by data matrix code
-    dict_of_all_dmc_counts = {}
-    # Create empty tuple to return according to selected values
-    tuple_of_result_values = tuple([] for _ in values)
-
-    # Iterate source path and check files with progress bar
-    for file_name in tqdm(
-        iterable=os.listdir(source),
-        desc="Loading from JSON: ",
-        disable=not verbose,
-    ):
-        # Check file types to load only json
-        if not file_name.endswith(".json"):
-            raise ImportWarning(
-                f"Source {source} should contain only JSON, but found: {file_name}."
+    # Get all JSON file names from source in one scan and skip all other files
+    all_file_names, skipped_file_names = [], []
+    with os.scandir(source) as entries:
+        for entry in entries:
+            if entry.name.endswith(".json"):
+                all_file_names.append(entry.name)
+            else:
+                skipped_file_names.append(entry.name)
+    # Report the skipped files once instead of aborting the load
+    if skipped_file_names and log:
+        logger.warning(
+            "Source %s should contain only JSON, skipped: %s.",
+            source,
+            skipped_file_names,
+        )
+
+    # Get the measurements to retain from the screw runs (all other values are dropped)
+    run_values = [v for v in values if v not in ("cycle number", "results")]
+
+    def load_screw_run(file_name: str) -> ScrewRun:
+        return ScrewRun(name=file_name, path=source, steps=steps, values=run_values)
+
+    # Load all files as ScrewRun concurrently (the order of the files is preserved)
+    with ThreadPoolExecutor(num_workers or DEFAULT_NUM_WORKERS) as executor:
+        all_screw_runs = list(
+            tqdm(
+                iterable=executor.map(load_screw_run, all_file_names),
+                total=len(all_file_names),
+                desc="Loading from JSON: ",
+                disable=not verbose,
             )
+        )
 
-        # Get current file as ScrewRun
-        screw_run = ScrewRun(name=file_name, path=source, steps=steps)
-        screw_run_dmc = screw_run.get_dmc()
+    # Create empty list to collect all screw runs
+    list_of_all_screw_runs = []
+    # Get the running count and the cycle of every screw run by data matrix code
+    dmc_counts, dmc_cycles = accumulate_dmcs(
+        np.array([screw_run.code for screw_run in all_screw_runs])
+    )
+    # Create tuple of preallocated arrays (one entry per file) to return the selected values
+    tuple_of_result_values = tuple(
+        np.empty(
+            len(all_screw_runs),
+            dtype=np.int32 if value_to_return == "cycle number" else object,
+        )
+        for value_to_return in values
+    )
 
-        # Update the dict of all dmcs counts for the current screw run
-        if screw_run_dmc in dict_of_all_dmc_counts.keys():
-            dict_of_all_dmc_counts[screw_run_dmc] += 1
-        else:
-            dict_of_all_dmc_counts[screw_run_dmc] = 1
+    # Transform cycles to a set (if int was provided) for constant-time lookups
+    if cycles is None:
+        cycle_filter = None
+    else:
+        cycle_filter = frozenset([cycles] if isinstance(cycles, int) else cycles)
 
-        # Get cycle of the current screw run (two screws per work piece)
-        # e.g. transform [1,2,3,4,5,...,48,49,50] to [1,1,2,2,3,...,24,25,25]
-        screw_run_cycle = (dict_of_all_dmc_counts[screw_run_dmc] - 1) // 2 + 1
+    # Iterate the loaded screw runs sequentially
+    for run_index, screw_run in enumerate(all_screw_runs):
+        screw_run_cycle = dmc_cycles[run_index]
 
-        # Transform cycles to list if int was provided
-        if isinstance(cycles, int):
-            cycles = [cycles]
         # Add current screw run to list of all screw runs if in cycles
-        if cycles is None or screw_run_cycle in cycles:
+        if cycle_filter is None or screw_run_cycle in cycle_filter:
             list_of_all_screw_runs.append(screw_run)
         else:  # Invalid cycles
             raise ValueError(f"Provided cycles yield no screw runs: {cycles}")
@@ -150,16 +239,46 @@ def load_from_json(
         # Add values from screw_runs to return tuple
         for i, value_to_return in enumerate(values):
             if value_to_return == "cycle number":
-                tuple_of_result_values[i].append(
-                    dict_of_all_dmc_counts[screw_run_dmc],
-                )
+                tuple_of_result_values[i][run_index] = dmc_counts[run_index]
             elif value_to_return == "results":
-                tuple_of_result_values[i].append(
-                    screw_run.get_result(),
-                )
+                tuple_of_result_values[i][run_index] = screw_run.result
             else:
-                tuple_of_result_values[i].append(
-                    screw_run.get_run_values(value_to_return)
+                tuple_of_result_values[i][run_index] = screw_run.get_run_values(
+                    value_to_return
                 )
 
     return tuple_of_result_values
+
+
+def accumulate_dmcs(codes: np.ndarray) -> Tuple[np.ndarray, np.ndarray]:
+    """
+    Count the occurrences of the data matrix codes (DMC) up to each screw run.
+
+    Parameters:
+    -----------
+    codes : np.ndarray
+        The DMC of every screw run, in the order in which the runs were recorded.
+
+    Returns:
+    --------
+    Tuple[np.ndarray, np.ndarray]
+        The running count of the DMC of each screw run (e.g. [1, 1, 2, 3, 2] for the codes
+        [a, b, a, a, b]) and the corresponding cycle (two screws per work piece, so that
+        the counts [1, 2, 3, 4, 5] yield the cycles [1, 1, 2, 2, 3]).
+    """
+    # Group the runs by DMC while keeping their recorded order within each group
+    _, group_ids = np.unique(codes, return_inverse=True)
+    order = np.argsort(group_ids, kind="stable")
+    sorted_group_ids = group_ids[order]
+
+    # Find where each group starts and number the runs within their group
+    is_group_start = np.ones(len(codes), dtype=bool)
+    is_group_start[1:] = sorted_group_ids[1:] != sorted_group_ids[:-1]
+    group_starts = np.flatnonzero(is_group_start)
+    group_sizes = np.diff(np.append(group_starts, len(codes)))
+    ranks = np.arange(len(codes)) - np.repeat(group_starts, group_sizes)
+
+    # Scatter the counts back to the recorded order of the runs
+    counts = np.empty(len(codes), dtype=np.int64)
+    counts[order] = ranks + 1
+    return counts, (counts - 1) // 2 + 1
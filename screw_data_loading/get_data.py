@@ -6,10 +6,13 @@ from typing import Any, List, Tuple, Union
 import numpy as np
 
 from screw_data_loading.load import (
+    from_cache,
     from_database,
     from_directory,
     from_hierarchical,
+    get_cache_path,
     get_logger,
+    to_cache,
 )
 from screw_data_loading.prep import validate_parameter
 
@@ -32,6 +35,8 @@ def get_data(
     split_seed: int = None,
     return_format: str = "nested_list",
     result_format: str = "binary",
+    return_lengths: bool = False,
+    cache_enabled: bool = False,
     logging_enabled: bool = True,
     verbose: bool = True,
 ) -> Union[
@@ -74,6 +79,14 @@ def get_data(
         Format for returning the data. Can be "nested_list" or "numpy_array". Default is "nested_list".
     result_format : str, optional
         Format for returning result values. Can be "raw" or "binary". Default is "binary".
+    return_lengths : bool, optional
+        Additionally return the number of values of every cycle without the padding (e.g.
+        to mask the padded values). Default is False.
+    cache_enabled : bool, optional
+        Cache the loaded data of a directory in a file next to it (reused as long as no file
+        in the directory changes), as well as the decoded files (reused for other
+        parameters, only changed files are decoded again). Default is False, where
+        nothing is cached (neither in a file nor in memory).
     logging_enabled : bool, optional
         Enable logging. Default is True.
     verbose : bool, optional
@@ -86,6 +99,9 @@ def get_data(
         Loaded and processed data.
         - If split_ratio is defined, returns (x_train, x_test, y_train, y_test).
         - If split_ratio is None, returns (x_data, y_data).
+        - If return_lengths is enabled, the lengths of the cycles are appended, i.e.
+          (x_train, x_test, y_train, y_test, lengths_train, lengths_test) or
+          (x_data, y_data, lengths).
         - The format of the returned data is determined by `return_format` (nested_list, flat_list, or numpy_array).
 
     Raises
@@ -120,10 +136,15 @@ def get_data(
 
     # Get a dictionary containing the current parameters
     kwargs = locals()
+    # The cache of the loaded data is handled here, the loaders only receive the data
+    # parameters (without a seed, the data is shuffled differently on every call and
+    # hence never cached, but the decoded files are still cached by from_directory)
+    cache_enabled = kwargs.pop("cache_enabled")
+    data_cache_enabled = cache_enabled and split_seed is not None
 
     # Log the starting of the data loading process
     if logging_enabled:
-        logger.info(f"Starting data loading process with parameters: {kwargs}")
+        logger.info("Starting data loading process with parameters: %s", kwargs)
 
     try:
         # Load data according to the provided source path
@@ -136,15 +157,26 @@ def get_data(
             if logging_enabled:
                 logger.info("Loaded data from H5 file.")
         elif os.path.isdir(source_path):
-            data = from_directory(**kwargs)
-            if logging_enabled:
-                logger.info("Loaded data from directory.")
+            # Reuse the data of a previous load if the directory did not change since
+            cache_path = (
+                get_cache_path(source_path, kwargs) if data_cache_enabled else None
+            )
+            data = from_cache(cache_path, source_path) if data_cache_enabled else None
+            if data is not None:
+                if logging_enabled:
+                    logger.info("Loaded data from cache file %s.", cache_path)
+            else:
+                data = from_directory(**kwargs, cache_enabled=cache_enabled)
+                if data_cache_enabled:
+                    to_cache(cache_path, data)
+                if logging_enabled:
+                    logger.info("Loaded data from directory.")
         else:
-            logger.error(f"Unsupported source type: {source_path}")
+            logger.error("Unsupported source type: %s", source_path)
             raise ValueError(f"Unsupported source type: {source_path}")
 
     except Exception as e:
-        logger.error(f"Failed to load data from {source_path}: {e}", exc_info=True)
+        logger.error("Failed to load data from %s: %s", source_path, e, exc_info=True)
         raise RuntimeError(f"Data loading failed for {source_path}.") from e
 
     return data
@@ -1,23 +1,58 @@
 # get_dict_from_json.py
 
-from json import load, JSONDecodeError
-from typing import Any, Union, Dict
+import mmap
+import os
+import stat
+from collections import OrderedDict
+from json import JSONDecodeError
+from threading import Lock
+from typing import Any, Union, Dict, Optional, Tuple
 from os.path import join
 
+import orjson
+
+# Min. file size (in bytes) to decode a JSON file from a memory map instead of a read copy
+MMAP_THRESHOLD = 64 * 1024
+
+# Keys of a screw run that are kept if only some values are selected
+RUN_KEYS = ("id code", "result")
+
+# Max. number of decoded JSON files kept in memory (roughly 100 KB of Python objects per
+# full screw run, i.e. about 25 MB, and a fraction of it if only some values are selected)
+CACHE_SIZE = 256
+# Decoded JSON files by absolute path and selected values, stored with their mtime and
+# size (LRU order), and the lock that guards them (files are loaded by several threads)
+_cache: "OrderedDict[Tuple[str, Any], Tuple[int, int, Dict[str, Any]]]" = OrderedDict()
+_cache_lock = Lock()
+
 
 def get_dict_from_json(
     file_path: str,
-    file_name: str,
+    file_name: str = None,
+    values: Optional[Tuple[str, ...]] = None,
+    cache_enabled: bool = True,
 ) -> Union[Dict[str, Any], None]:
     """
     Loads JSON data from a specified file into a dictionary.
 
+    Decoded files are cached by path, modification time and size (up to CACHE_SIZE
+    files), so that loading the same unchanged file again skips reading and decoding it.
+    Every call returns its own copy of the dicts and lists (see `copy_json`), so that
+    modifying a returned dict never changes the cached data. If only some values are
+    selected, only these are kept (and cached), see `select_run_values`.
+
     Parameters
     ----------
     file_path : str
-        Path to the directory containing the JSON file.
-    file_name : str
+        Path to the directory containing the JSON file (or the full path to the JSON file,
+        if no file_name is provided).
+    file_name : str, optional
         Name of the JSON file to be loaded.
+    values : Optional[Tuple[str, ...]], optional
+        The graph values of the tightening steps to keep (e.g. ("time values", "torque
+        values")). Defaults to None, where the whole file is returned.
+    cache_enabled : bool, optional
+        Whether to look up and store the decoded file in the cache. Defaults to True.
 
     Returns
     -------
@@ -38,25 +73,177 @@ def get_dict_from_json(
     >>>     print(data)
     """
 
-    # Construct the full path to the JSON file
-    json_file_path = join(file_path, file_name)
+    # Construct the full path to the JSON file (unless it is provided already)
+    json_file_path = file_path if file_name is None else join(file_path, file_name)
 
     # Attempt to open and load the JSON file
     try:
-        with open(json_file_path, "r") as json_file:
-            return load(json_file)
+        # Return the cached dict if the file did not change since it was decoded (only
+        # regular files, the content of a pipe is not identified by its mtime and size)
+        cache_key = (os.path.abspath(json_file_path), values)
+        file_stat = os.stat(json_file_path)
+        is_regular_file = stat.S_ISREG(file_stat.st_mode)
+        cache_enabled = cache_enabled and is_regular_file
+        with _cache_lock:
+            cached = _cache.get(cache_key) if cache_enabled else None
+            if cached is not None and cached[:2] == (
+                file_stat.st_mtime_ns,
+                file_stat.st_size,
+            ):
+                _cache.move_to_end(cache_key)
+                cached_dict = cached[2]
+            else:
+                cached_dict = None
+        if cached_dict is not None:
+            return copy_json(cached_dict)
+
+        fd = os.open(json_file_path, os.O_RDONLY)
+        try:
+            if not is_regular_file:
+                # Pipes have no size and cannot be mapped, read them until the end
+                json_dict = orjson.loads(read_until_end(fd))
+            else:
+                # Hint the kernel to read the file ahead in larger chunks (not on all
+                # platforms), the file is read once from start to end
+                if hasattr(os, "posix_fadvise"):
+                    os.posix_fadvise(fd, 0, 0, os.POSIX_FADV_SEQUENTIAL)
+                file_size = os.fstat(fd).st_size
+                if file_size >= MMAP_THRESHOLD:
+                    # Decode larger files directly from the mapped pages without a copy
+                    with mmap.mmap(fd, 0, access=mmap.ACCESS_READ) as json_map:
+                        with memoryview(json_map) as json_view:
+                            json_dict = orjson.loads(json_view)
+                else:
+                    # Read the (small) file without Python-level buffering
+                    json_dict = orjson.loads(read_until_end(fd, file_size))
+        finally:
+            os.close(fd)
+
+        # Drop everything but the selected values (before caching the dict)
+        if values is not None:
+            json_dict = select_run_values(json_dict, values)
+
+        # Pipes are not cached, see above
+        if not cache_enabled:
+            return json_dict
+
+        # Cache the decoded dict (replaces outdated entries of the same file) and return a
+        # copy of it, so that the cached dict is never handed out
+        with _cache_lock:
+            _cache[cache_key] = (file_stat.st_mtime_ns, file_stat.st_size, json_dict)
+            _cache.move_to_end(cache_key)
+            if len(_cache) > CACHE_SIZE:
+                _cache.popitem(last=False)
+        return copy_json(json_dict)
     # Handle file not found error
     except FileNotFoundError as e:
         raise FileNotFoundError(
             f"JSON file not found ({json_file_path}): {e}",
         ) from e
     # Handle JSON decoding errors
-    except JSONDecodeError as e:
+    except JSONDecodeError as e:  # also catches orjson.JSONDecodeError (subclass)
         raise JSONDecodeError(
-            f"Error decoding JSON file ({json_file_path}): {e}",
+            f"Error decoding JSON file ({json_file_path}): {e.msg}",
+            e.doc,
+            e.pos,
         ) from e
     # Handle any other unexpected errors
     except Exception as e:
         raise RuntimeError(
             f"An unexpected error occurred while loading JSON file ({json_file_path}): {e}",
         ) from e
+
+
+def select_run_values(
+    json_dict: Dict[str, Any], values: Tuple[str, ...]
+) -> Dict[str, Any]:
+    """
+    Reduces a decoded screw run to its id code, result and the selected graph values.
+
+    The JSON files contain a lot of metadata (e.g. "prg name" or "tightening functions")
+    and further graph values that are not required for loading the measurements. Keeping
+    only the required values cuts the memory of the cached dicts to a fraction. Missing
+    keys remain missing, and all steps are kept (so that they are selected by position).
+
+    Parameters
+    ----------
+    json_dict : Dict[str, Any]
+        The decoded JSON file of a screw run.
+    values : Tuple[str, ...]
+        The graph values of the tightening steps to keep.
+
+    Returns
+    -------
+    Dict[str, Any]
+        The reduced screw run, e.g. {"id code": ..., "result": ..., "tightening steps":
+        [{"graph": {"torque values": [...]}}, ...]}.
+    """
+    run_dict = {key: json_dict[key] for key in RUN_KEYS if key in json_dict}
+    steps = json_dict.get("tightening steps")
+    if steps is not None:
+        run_dict["tightening steps"] = [
+            {"graph": {value: graph[value] for value in values if value in graph}}
+            for graph in (step.get("graph", {}) for step in steps)
+        ]
+    return run_dict
+
+
+def copy_json(obj: Any) -> Any:
+    """
+    Copies the dicts and lists of decoded JSON data (the strings and numbers are shared).
+
+    The decoded files only contain arrays of either objects/arrays or of plain values (e.g.
+    the graph values), so arrays of plain values are copied as a whole (in C) instead of
+    element by element. This takes a fraction of the time of decoding the file again.
+
+    Parameters
+    ----------
+    obj : Any
+        The decoded JSON data (e.g. a dict of a screw run).
+
+    Returns
+    -------
+    Any
+        A copy of the data that shares no dict or list with the provided data.
+    """
+    if isinstance(obj, dict):
+        return {key: copy_json(value) for key, value in obj.items()}
+    if isinstance(obj, list):
+        if obj and isinstance(obj[0], (dict, list)):
+            return [copy_json(value) for value in obj]
+        return obj[:]
+    return obj
+
+
+def read_until_end(fd: int, size_hint: int = 0) -> bytes:
+    """
+    Reads all remaining bytes from a file descriptor.
+
+    A single `os.read` may return fewer bytes than requested (e.g. for pipes), so the
+    file is read until the end. For a regular file with a correct size hint, this is a
+    single read plus one empty read at the end.
+
+    Parameters
+    ----------
+    fd : int
+        The file descriptor to read from.
+    size_hint : int, optional
+        The expected number of bytes (e.g. the file size). Defaults to 0.
+
+    Returns
+    -------
+    bytes
+        The bytes read from the file descriptor.
+    """
+    chunks = []
+    chunk = os.read(fd, max(size_hint, 64 * 1024))
+    while chunk:
+        chunks.append(chunk)
+        chunk = os.read(fd, 64 * 1024)
+    return chunks[0] if len(chunks) == 1 else b"".join(chunks)
+
+
+def clear_json_cache() -> None:
+    """Removes all decoded JSON files from the cache of get_dict_from_json."""
+    with _cache_lock:
+        _cache.clear()
@@ -0,0 +1,128 @@
+# get_dicts_from_json.py
+
+import os
+from collections import deque
+from concurrent.futures import ThreadPoolExecutor
+from itertools import repeat
+from typing import Any, Dict, Iterable, Iterator, List, Optional, Tuple
+
+from .get_dict_from_json import get_dict_from_json
+
+# Default number of threads to read JSON files concurrently (reading is I/O-bound)
+DEFAULT_NUM_WORKERS = min(32, (os.cpu_count() or 1) * 4)
+
+
+def get_dicts_from_json(
+    file_paths: List[str],
+    file_names: List[str],
+    num_workers: int = None,
+    cache_enabled: bool = True,
+) -> List[Dict[str, Any]]:
+    """
+    Loads JSON data from several files into a list of dictionaries.
+
+    The files are read concurrently by a pool of threads, so that the blocking reads of
+    many small files overlap instead of waiting for each other.
+
+    Parameters
+    ----------
+    file_paths : List[str]
+        Paths to the directories containing the JSON files.
+    file_names : List[str]
+        Names of the JSON files to be loaded (same length as file_paths).
+    num_workers : int, optional
+        Number of threads to read the files. Defaults to DEFAULT_NUM_WORKERS.
+    cache_enabled : bool, optional
+        Whether to cache the decoded files (see `get_dict_from_json`). Defaults to True.
+
+    Returns
+    -------
+    List[Dict[str, Any]]
+        A list of dictionaries containing the JSON data, in the order of file_names.
+
+    Raises
+    ------
+    FileNotFoundError
+        If one of the specified JSON files is not found.
+    JSONDecodeError
+        If there is an error decoding one of the JSON files.
+
+    Examples
+    --------
+    >>> data = get_dicts_from_json(['data', 'data'], ['first.json', 'second.json'])
+    >>> print(len(data))
+    """
+    with ThreadPoolExecutor(num_workers or DEFAULT_NUM_WORKERS) as executor:
+        return list(
+            executor.map(
+                get_dict_from_json,
+                file_paths,
+                file_names,
+                repeat(None),
+                repeat(cache_enabled),
+            )
+        )
+
+
+def iter_dicts_from_json(
+    file_paths: Iterable[str],
+    file_names: Iterable[str] = None,
+    num_workers: int = None,
+    values: Optional[Tuple[str, ...]] = None,
+    cache_enabled: bool = True,
+) -> Iterator[Dict[str, Any]]:
+    """
+    Loads JSON data from several files and yields the dictionaries one by one.
+
+    Like `get_dicts_from_json`, the files are read concurrently by a pool of threads, but
+    only a limited number of files (twice the number of threads) is read ahead of the
+    consumer, so that not all decoded files are held in memory at once.
+
+    Parameters
+    ----------
+    file_paths : Iterable[str]
+        Paths to the directories containing the JSON files (or the full paths to the JSON
+        files, if no file_names are provided).
+    file_names : Iterable[str], optional
+        Names of the JSON files to be loaded (same length as file_paths).
+    num_workers : int, optional
+        Number of threads to read the files. Defaults to DEFAULT_NUM_WORKERS.
+    values : Optional[Tuple[str, ...]], optional
+        The graph values of the tightening steps to keep (see `get_dict_from_json`).
+        Defaults to None, where the whole files are returned.
+    cache_enabled : bool, optional
+        Whether to cache the decoded files (see `get_dict_from_json`). Defaults to True.
+
+    Yields
+    ------
+    Dict[str, Any]
+        The dictionaries containing the JSON data, in the order of file_names.
+
+    Raises
+    ------
+    FileNotFoundError
+        If one of the specified JSON files is not found.
+    JSONDecodeError
+        If there is an error decoding one of the JSON files.
+
+    Examples
+    --------
+    >>> for data in iter_dicts_from_json(['data', 'data'], ['first.json', 'second.json']):
+    >>>     print(data["result"])
+    """
+    num_workers = num_workers or DEFAULT_NUM_WORKERS
+    if file_names is None:
+        file_names = repeat(None)
+    with ThreadPoolExecutor(num_workers) as executor:
+        pending = deque()
+        for file_path, file_name in zip(file_paths, file_names):
+            pending.append(
+                executor.submit(
+                    get_dict_from_json, file_path, file_name, values, cache_enabled
+                )
+            )
+            # Wait for the oldest file once enough files are read ahead
+            if len(pending) >= 2 * num_workers:
+                yield pending.popleft().result()
+        while pending:
+            yield pending.popleft().result()
@@ -1,8 +1,20 @@
-from typing import List, Dict, Union, Any
+from types import MappingProxyType
+from typing import List, Dict, Mapping, Union, Any
+
+import numpy as np
+
+# Returned for values that are missing in the graph of a step (read-only, as it is shared)
+EMPTY_VALUES = np.empty(0, dtype=np.float32)
+EMPTY_VALUES.flags.writeable = False
 
 
 class ScrewStep:
-    def __init__(self, step_dict: Dict[str, Any]) -> None:
+    # Fixed set of attributes to avoid an instance dict for every screw step
+    __slots__ = ("name", "_graph", "_arrays")
+
+    def __init__(
+        self, step_dict: Dict[str, Any], value_types: List[str] = None
+    ) -> None:
         """
         Initialize a ScrewStep object.
 
@@ -10,6 +22,8 @@ class ScrewStep:
         -----------
         `step_dict (dict):` Dictionary containing all data for the screw step.
 
+        `value_types (list):` Types of values to retain from the graph (default: all).
+
         Example:
         --------
         ```
@@ -50,44 +64,47 @@ class ScrewStep:
         self.name: str = step_dict.get("name", "")
 
         # Measured values of the screw run, such as angle, torque gradient or time
-        self.values: Dict[str, List[Union[int, float]]] = step_dict.get("graph", {})
-
-        # For sake of documentation, the remaining attributes can be loded as well
-        if False:
-            # Type of tightening step
-            self.step_type = str(step_dict["step type"])  # "standard"
-            # Row number
-            self.row = int(step_dict["row"])
-            # Column letter
-            self.column = str(step_dict["column"])
-            # Last command executed
-            self.last_cmd = str(step_dict["last cmd"])
-            # Quality code
-            self.quality_code = str(step_dict["quality code"])  # "1"
-            # Tightening speed
-            self.speed = int(step_dict["speed"])
-            # Category of the step
-            self.category = int(step_dict["category"])  # "0"
-            # Documentation buffer
-            self.docu_buffer = int(step_dict["docu buffer"])  # "0"
-            # Result of the tightening step
-            self.result = str(step_dict["result"])
-            # Angle threshold information
-            self.angle_threshold = dict(step_dict["angle threshold"])
-            # List with dicts of tightening functions
-            self.tightening_functions = list(step_dict["tightening functions"])
-
-    def get_values(self, value_type: str) -> List[Union[int, float]]:
+        graph = step_dict.get("graph", {})
+        if value_types is not None:
+            # Only keep the requested values, so the others can be freed with the dict
+            graph = {k: graph[k] for k in value_types if k in graph}
+        else:
+            # Own dict of the values, so that removing the converted values (see
+            # get_values) never modifies the provided step dict
+            graph = dict(graph)
+        # Raw (not yet converted) values of the graph, removed once they are converted
+        self._graph: Dict[str, List[Union[int, float]]] = graph
+        # Values converted to contiguous float32 arrays, filled when first accessed
+        self._arrays: Dict[str, np.ndarray] = {}
+
+    @property
+    def values(self) -> Mapping[str, np.ndarray]:
+        """
+        All values of the graph by value type, as float32 arrays (read-only mapping).
+
+        Accessing this converts all values of the graph that were not accessed yet (see
+        `get_values` to convert only a single value type).
+        """
+        for value_type, raw_values in self._graph.items():
+            self._arrays[value_type] = np.asarray(raw_values, dtype=np.float32)
+        self._graph.clear()
+        return MappingProxyType(self._arrays)
+
+    def get_values(self, value_type: str) -> np.ndarray:
         """
         Retrieve specified values from the graph data.
 
+        The values are converted to a float32 array on the first access (and only then), so
+        measurements that are never requested are not copied. The raw values are dropped
+        after the conversion.
+
         Parameters:
         -----------
         `value_type (str)`: Type of values to retrieve from the tightening step.
 
         Returns:
         --------
-        `List[Union[int, float]]`:List of values from the specified graph.
+        `np.ndarray`: Array (float32) of values from the specified graph.
 
         """
         valid_types = [
@@ -100,4 +117,11 @@ class ScrewStep:
         ]
         if value_type not in valid_types:
             raise ValueError(f"Invalid type for value provided: {value_type}")
-        return self.values.get(value_type, [])
+        values = self._arrays.get(value_type)
+        if values is None:
+            # Remove the raw values, so that they are not kept next to the array
+            raw_values = self._graph.pop(value_type, None)
+            if raw_values is None:
+                return EMPTY_VALUES
+            values = self._arrays[value_type] = np.asarray(raw_values, dtype=np.float32)
+        return values
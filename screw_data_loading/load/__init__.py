@@ -1,5 +1,6 @@
 from .from_directory import from_directory
 from .from_database import from_database
 from .from_hierarchical import from_hierarchical
+from .from_cache import from_cache, get_cache_path, iter_cached_runs, to_cache
 from ..prep.validating import validate_parameter
 from ..logs import get_logger
@@ -0,0 +1,449 @@
+# from_cache.py
+
+import hashlib
+import os
+import zipfile
+from itertools import chain
+from typing import Any, Callable, Dict, Iterator, List, Optional, Tuple
+
+import numpy as np
+import orjson
+
+from screw_data_loading.json.get_dicts_from_json import iter_dicts_from_json
+from screw_data_loading.logs import get_logger
+
+# Configure logging
+logger = get_logger(__name__)
+
+# Data types of the cached graph values (the time in full precision, see to_run_arrays)
+DTYPE = np.float32
+TIME_KEY = "time values"
+
+# Version of the cached data (changed whenever the same parameters load different data
+# or the format of the cache files changes)
+CACHE_VERSION = 3
+
+# Errors of reading or decoding a cache file that is broken or of another format
+CACHE_FILE_ERRORS = (
+    OSError,
+    EOFError,
+    ValueError,
+    KeyError,
+    IndexError,
+    TypeError,
+    zipfile.BadZipFile,
+)
+
+# Parameters that do not change the loaded data (and are ignored for the cache key)
+IGNORED_PARAMETERS = ("source_path", "cache_enabled", "logging_enabled", "verbose")
+
+
+def get_cache_path(source_path: str, params: Dict[str, Any]) -> str:
+    """
+    Get the path of the cache file for loading a directory with the given parameters.
+
+    The cache file is placed next to the source directory and named after it, with a
+    digest of all parameters that affect the loaded data (e.g. "data/10k_x25.3f2a...npz").
+
+    Parameters
+    ----------
+    source_path : str
+        Path to the data source (directory of JSON files).
+    params : Dict[str, Any]
+        The (validated) parameters of get_data.
+
+    Returns
+    -------
+    str
+        The path of the cache file.
+    """
+    relevant_params = {
+        k: v for k, v in sorted(params.items()) if k not in IGNORED_PARAMETERS
+    }
+    relevant_params["cache_version"] = CACHE_VERSION
+    digest = hashlib.sha1(repr(relevant_params).encode()).hexdigest()[:16]
+    return f"{os.path.normpath(source_path)}.{digest}.npz"
+
+
+def get_source_mtime(source_path: str) -> int:
+    """
+    Get the latest modification time (in ns) of the source directory and its files.
+
+    Parameters
+    ----------
+    source_path : str
+        Path to the data source (directory of JSON files).
+
+    Returns
+    -------
+    int
+        The latest modification time, including the directory itself (which changes if
+        files are added or removed).
+    """
+    latest_mtime = os.stat(source_path).st_mtime_ns
+    with os.scandir(source_path) as entries:
+        for entry in entries:
+            latest_mtime = max(latest_mtime, entry.stat().st_mtime_ns)
+    return latest_mtime
+
+
+def from_cache(cache_path: str, source_path: str) -> Optional[List[Any]]:
+    """
+    Load the data from the cache file, if it exists and is newer than the source.
+
+    Parameters
+    ----------
+    cache_path : str
+        Path of the cache file (see `get_cache_path`).
+    source_path : str
+        Path to the data source (directory of JSON files).
+
+    Returns
+    -------
+    Optional[List[Any]]
+        The cached data, or None if there is no valid cache file.
+    """
+    try:
+        if os.stat(cache_path).st_mtime_ns <= get_source_mtime(source_path):
+            return None
+    except FileNotFoundError:
+        return None
+    return read_cache_file(cache_path, decode_data)
+
+
+def read_cache_file(
+    cache_path: str, decode: Callable[[Dict[str, np.ndarray]], Any]
+) -> Optional[Any]:
+    """
+    Load the data from the cache file (without checking if it is outdated).
+
+    The cache files are NumPy .npz files that are loaded with `allow_pickle=False`, so
+    that a (foreign) file next to the data directory can never run code. Any file that
+    cannot be read or decoded (e.g. of an older version) is ignored like a missing one.
+
+    Parameters
+    ----------
+    cache_path : str
+        Path of the cache file.
+    decode : Callable[[Dict[str, np.ndarray]], Any]
+        Function to decode the arrays of the file (e.g. `decode_data`).
+
+    Returns
+    -------
+    Optional[Any]
+        The cached data, or None if the cache file does not exist or cannot be read.
+    """
+    try:
+        with np.load(cache_path, allow_pickle=False) as cache_file:
+            return decode({name: cache_file[name] for name in cache_file.files})
+    except FileNotFoundError:
+        return None
+    except CACHE_FILE_ERRORS as e:
+        logger.warning("Ignoring unreadable cache file %s: %s", cache_path, e)
+        return None
+
+
+def write_cache_file(cache_path: str, arrays: Dict[str, np.ndarray]) -> None:
+    """
+    Write the arrays to the cache file (an uncompressed .npz file).
+
+    The file is written to a temporary file first and then renamed, so that an aborted
+    write never leaves a truncated cache file behind. Failing to write the cache is not
+    an error (the data is simply loaded from the source again next time).
+
+    Parameters
+    ----------
+    cache_path : str
+        Path of the cache file (see `get_cache_path`).
+    arrays : Dict[str, np.ndarray]
+        The arrays to store by name (without objects, see `read_cache_file`).
+    """
+    temp_path = f"{cache_path}.{os.getpid()}.tmp"
+    try:
+        # Written to a file object, since np.savez appends ".npz" to other file names
+        with open(temp_path, "wb") as cache_file:
+            np.savez(cache_file, **arrays)
+        os.replace(temp_path, cache_path)
+    except OSError as e:
+        logger.warning("Failed to write cache file %s: %s", cache_path, e)
+        if os.path.exists(temp_path):
+            os.remove(temp_path)
+
+
+def to_cache(cache_path: str, data: List[Any]) -> None:
+    """
+    Write the loaded data to the cache file (see `encode_data`).
+
+    Parameters
+    ----------
+    cache_path : str
+        Path of the cache file (see `get_cache_path`).
+    data : List[Any]
+        The loaded data as returned by `from_directory`.
+    """
+    arrays = encode_data(data)
+    if arrays is None:
+        logger.info("The loaded data cannot be cached in %s.", cache_path)
+        return
+    write_cache_file(cache_path, arrays)
+
+
+def encode_data(data: List[Any]) -> Optional[Dict[str, np.ndarray]]:
+    """
+    Encode the loaded data as arrays of numbers or strings (see `decode_data`).
+
+    Arrays are stored as they are. Nested lists (e.g. of the nested_list return format)
+    are stored as the flat array of their values and the lengths of the lists of every
+    level of nesting, so that ragged lists (e.g. cycles without padding) are stored as
+    well.
+
+    Parameters
+    ----------
+    data : List[Any]
+        The loaded data as returned by `from_directory` (arrays or nested lists).
+
+    Returns
+    -------
+    Optional[Dict[str, np.ndarray]]
+        The arrays to store, or None if the data cannot be stored without objects (e.g.
+        lists of values of mixed types).
+    """
+    arrays, depths = {}, []
+    for i, entry in enumerate(data):
+        if isinstance(entry, np.ndarray):
+            values, depth = entry, 0
+        else:
+            # Flatten the lists level by level, storing the lengths of every level
+            values, depth = list(entry), 1
+            while values and isinstance(values[0], list):
+                if not all(isinstance(value, list) for value in values):
+                    return None
+                lengths = np.array([len(value) for value in values], dtype=np.int64)
+                arrays[f"lengths_{i}_{depth - 1}"] = lengths
+                values = list(chain.from_iterable(values))
+                depth += 1
+            # Every value must come back as the same type (e.g. not ints as floats)
+            if len(set(map(type, values))) > 1:
+                return None
+            values = np.asarray(values)
+        if values.dtype.hasobject or (depth > 0 and values.ndim != 1):
+            return None
+        arrays[f"values_{i}"] = values
+        depths.append(depth)
+    arrays["depths"] = np.array(depths, dtype=np.int64)
+    return arrays
+
+
+def decode_data(arrays: Dict[str, np.ndarray]) -> List[Any]:
+    """
+    Decode the loaded data from the arrays of the cache file (see `encode_data`).
+
+    Parameters
+    ----------
+    arrays : Dict[str, np.ndarray]
+        The arrays of the cache file by name.
+
+    Returns
+    -------
+    List[Any]
+        The loaded data as returned by `from_directory`.
+    """
+    data = []
+    for i, depth in enumerate(arrays["depths"].tolist()):
+        values = arrays[f"values_{i}"]
+        if depth > 0:
+            # Rebuild the lists from the innermost level of nesting outwards
+            values = values.tolist()
+            for level in reversed(range(depth - 1)):
+                ends = np.cumsum(arrays[f"lengths_{i}_{level}"]).tolist()
+                if (ends[-1] if ends else 0) != len(values):
+                    raise ValueError(
+                        f"Inconsistent lengths of entry {i} in cache file."
+                    )
+                starts = [0] + ends[:-1]
+                values = [values[start:end] for start, end in zip(starts, ends)]
+        data.append(values)
+    return data
+
+
+def iter_cached_runs(
+    file_entries: List[os.DirEntry],
+    values: Tuple[str, ...],
+    cache_path: str,
+) -> Iterator[Dict[str, Any]]:
+    """
+    Yield the reduced screw runs of the JSON files, reusing the runs of previous loads.
+
+    Other than the cache of `from_cache` (of the processed data, for the exact same
+    parameters), this cache holds the decoded values of every file (see
+    `select_run_values`), so that loading the same directory with different steps,
+    cycles or preprocessing parameters skips decoding the JSON files. Only the files that
+    were added or changed (by modification time and size) since are decoded, and the
+    cache file is updated after the last file was yielded.
+
+    Parameters
+    ----------
+    file_entries : List[os.DirEntry]
+        The JSON files to load (e.g. from `os.scandir`).
+    values : Tuple[str, ...]
+        The graph values of the tightening steps to load (e.g. ("time values",)).
+    cache_path : str
+        Path of the cache file (see `get_cache_path`).
+
+    Yields
+    ------
+    Dict[str, Any]
+        The reduced screw runs (with the graph values as arrays, see `to_run_arrays`), in
+        the order of the file entries.
+    """
+    cached_runs = read_cache_file(cache_path, decode_runs) or {}
+    file_stats = [
+        (file_stat.st_mtime_ns, file_stat.st_size)
+        for file_stat in (entry.stat() for entry in file_entries)
+    ]
+
+    # Decode only the files that are not cached (in the background, see below)
+    missing_paths = [
+        entry.path
+        for entry, file_stat in zip(file_entries, file_stats)
+        if cached_runs.get(entry.name, (None, None))[:2] != file_stat
+    ]
+    # (not cached in memory as well, since the runs are cached in the file)
+    missing_runs = iter_dicts_from_json(
+        missing_paths, values=values, cache_enabled=False
+    )
+
+    runs = {}
+    for entry, file_stat in zip(file_entries, file_stats):
+        cached = cached_runs.get(entry.name)
+        if cached is not None and cached[:2] == file_stat:
+            run = cached[2]
+        else:
+            run = to_run_arrays(next(missing_runs))
+        runs[entry.name] = (*file_stat, run)
+        yield run
+
+    # Only rewrite the cache if files were added, changed or removed
+    if missing_paths or len(runs) != len(cached_runs):
+        write_cache_file(cache_path, encode_runs(runs))
+
+
+def to_run_arrays(run: Dict[str, Any]) -> Dict[str, Any]:
+    """
+    Convert the graph values of a reduced screw run to arrays.
+
+    The arrays of all runs are stored as a few flat arrays (see `encode_runs`), which makes
+    reading the cache fast. The measurements are stored as float32 (the data type they are
+    returned in), which halves the size of the cache file and gives the same values as
+    converting the decoded float64 values later on. Only the time is kept as float64,
+    since it defines the grid of the equidistancing.
+    """
+    steps = run.get("tightening steps")
+    if steps is None:
+        return run
+    return {
+        **run,
+        "tightening steps": [
+            {
+                "graph": {
+                    key: np.asarray(
+                        values, dtype=np.float64 if key == TIME_KEY else DTYPE
+                    )
+                    for key, values in step["graph"].items()
+                }
+            }
+            for step in steps
+        ],
+    }
+
+
+def encode_runs(
+    runs: Dict[str, Tuple[int, int, Dict[str, Any]]],
+) -> Dict[str, np.ndarray]:
+    """
+    Encode the cached runs of `iter_cached_runs` as arrays (see `decode_runs`).
+
+    The graph values of all runs are concatenated into one flat array per data type
+    (float32 for the measurements and float64 for the time, see `to_run_arrays`). All other
+    data (the file names, their modification time and size, the id code and result of
+    every run and the position of every graph value in the flat arrays) is stored as JSON
+    in an array of bytes of the same file.
+
+    Parameters
+    ----------
+    runs : Dict[str, Tuple[int, int, Dict[str, Any]]]
+        The modification time, size and reduced run (see `to_run_arrays`) by file name.
+
+    Returns
+    -------
+    Dict[str, np.ndarray]
+        The arrays to store.
+    """
+    chunks = {np.float32: [], np.float64: []}
+    offsets = {np.float32: 0, np.float64: 0}
+    run_infos = {}
+    for name, (mtime, size, run) in runs.items():
+        steps = run.get("tightening steps")
+        step_infos = None
+        if steps is not None:
+            step_infos = []
+            for step in steps:
+                graph_info = {}
+                for key, values in step["graph"].items():
+                    dtype = np.float64 if key == TIME_KEY else DTYPE
+                    chunks[dtype].append(values)
+                    graph_info[key] = [offsets[dtype], len(values)]
+                    offsets[dtype] += len(values)
+                step_infos.append(graph_info)
+        info = {key: value for key, value in run.items() if key != "tightening steps"}
+        run_infos[name] = [mtime, size, info, step_infos]
+    return {
+        "runs": np.frombuffer(orjson.dumps(run_infos), dtype=np.uint8),
+        **{
+            np.dtype(dtype).name: (
+                np.concatenate(values) if values else np.empty(0, dtype)
+            )
+            for dtype, values in chunks.items()
+        },
+    }
+
+
+def decode_runs(
+    arrays: Dict[str, np.ndarray],
+) -> Dict[str, Tuple[int, int, Dict[str, Any]]]:
+    """
+    Decode the cached runs of `iter_cached_runs` from the arrays of the cache file.
+
+    Parameters
+    ----------
+    arrays : Dict[str, np.ndarray]
+        The arrays of the cache file by name (see `encode_runs`).
+
+    Returns
+    -------
+    Dict[str, Tuple[int, int, Dict[str, Any]]]
+        The modification time, size and reduced run by file name (the graph values are
+        views of the flat arrays).
+    """
+    flat_values = {
+        np.float32: arrays["float32"].astype(np.float32, copy=False),
+        np.float64: arrays["float64"].astype(np.float64, copy=False),
+    }
+    runs = {}
+    for name, (mtime, size, info, step_infos) in orjson.loads(
+        arrays["runs"].tobytes()
+    ).items():
+        run = dict(info)
+        if step_infos is not None:
+            steps = []
+            for graph_info in step_infos:
+                graph = {}
+                for key, (offset, length) in graph_info.items():
+                    values = flat_values[np.float64 if key == TIME_KEY else DTYPE]
+                    if offset + length > len(values):
+                        raise ValueError(f"Values of {name} out of range.")
+                    graph[key] = values[offset : offset + length]
+                steps.append({"graph": graph})
+            run["tightening steps"] = steps
+        runs[name] = (mtime, size, run)
+    return runs
@@ -1,5 +1,6 @@
 # from_directory.py
 
+import logging
 import os
 from dataclasses import dataclass
 from typing import Any, Dict, List, Tuple, Union
@@ -7,15 +8,15 @@ from typing import Any, Dict, List, Tuple, Union
 import numpy as np
 from tqdm import tqdm
 
-from screw_data_loading.json.get_dict_from_json import get_dict_from_json
+from screw_data_loading.json.get_dicts_from_json import iter_dicts_from_json
+from screw_data_loading.load.from_cache import get_cache_path, iter_cached_runs
 from screw_data_loading.logs import get_logger
 from screw_data_loading.prep import (
     apply_conversion,
-    apply_equidistancing,
-    apply_padding,
     apply_split,
-    apply_truncating,
+    build_cycle,
 )
+from screw_data_loading.prep.converting import convert_to_binary
 
 
 @dataclass
@@ -31,6 +32,9 @@ class KeyNames:
 # Configure logging
 logger = get_logger(__name__)
 
+# Data type of the returned measurements (torque, angle, etc. do not need float64)
+DTYPE = np.float32
+
 
 def from_directory(
     source_path: str,
@@ -48,6 +52,8 @@ def from_directory(
     result_format: str,
     logging_enabled: bool,
     verbose: bool,
+    cache_enabled: bool = False,
+    return_lengths: bool = False,
 ) -> Union[
     Tuple[List[Any], List[Any], List[Any], List[Any]],
     Tuple[List[Any], List[Any]],
@@ -88,6 +94,13 @@ def from_directory(
         Enable logging.
     verbose : bool
         Enable verbose output.
+    cache_enabled : bool, optional
+        Cache the decoded values of every file in a file next to the directory, so that
+        only added or changed files are decoded again (also if other parameters change).
+        Defaults to False, where the decoded files are not cached at all.
+    return_lengths : bool, optional
+        Additionally return the number of values of every cycle without the padding.
+        Defaults to False.
 
     Returns
     -------
@@ -95,30 +108,91 @@ def from_directory(
         Loaded and processed data.
         - If split_ratio is defined, returns (x_train, x_test, y_train, y_test).
         - If split_ratio is None, returns (x_data, y_data).
+        - If return_lengths is enabled, the lengths of the cycles are appended, i.e.
+          (x_train, x_test, y_train, y_test, lengths_train, lengths_test) or
+          (x_data, y_data, lengths).
     """
     KN = KeyNames("id code", "result", "tightening steps", "graph")
 
-    # Get all file names in the source path
-    all_file_names = os.listdir(source_path)
+    # Get all JSON files in the source path (the entries already carry the joined path),
+    # sorted by name: the order of os.scandir depends on the file system, but the cycles
+    # of every DMC are counted in the order of the files (named by their run number)
+    with os.scandir(source_path) as entries:
+        all_file_entries = sorted(
+            (
+                entry
+                for entry in entries
+                if entry.name.endswith(".json") and entry.is_file()
+            ),
+            key=lambda entry: entry.name,
+        )
 
     # Initialize a dictionary to count tightening cycles
     all_cycle_counts: Dict[str, int] = {}
 
-    # Initialize a nested list to return all tightening values (including label)
-    return_values: List[List[Any]] = [[] for _ in range(len(tightening_values) + 1)]
-
-    # Initialize lists to store metrics for logging
-    equidistancing_logs: List[Tuple[int, int]] = []
-    padding_logs: List[Tuple[int, int]] = []
-    truncating_logs: List[Tuple[int, int]] = []
-
-    # Iterate over all JSON file names
-    for file_name in tqdm(
-        all_file_names, desc="Loading and preparing data: ", disable=not verbose
+    # Check once which of the preprocessing steps are enabled (for logging)
+    truncating_enabled = target_length is not None and cutoff_position is not None
+    padding_enabled = padding_value is not None and padding_position is not None
+
+    # Initialize a nested list to return all tightening values (including label): with
+    # padding, every cycle has the target length and build_cycle writes the values
+    # directly into one preallocated array of all cycles, with one block of rows per
+    # value type in the row order of build_cycle (the time last) and trimmed to the
+    # number of loaded cycles below
+    if padding_enabled:
+        buffer_values = [value for value in tightening_values if value != "time"]
+        buffer_values = list(dict.fromkeys(buffer_values))
+        if "time" in tightening_values:
+            buffer_values.append("time")
+        cycles_buffer = np.empty(
+            (len(buffer_values), len(all_file_entries), target_length), dtype=DTYPE
+        )
+        return_values: List[Any] = [
+            cycles_buffer[buffer_values.index(value)] for value in tightening_values
+        ]
+    else:
+        return_values = [[] for _ in tightening_values]
+    return_values.append([])
+
+    # Initialize an array to store the lengths of every cycle for logging (initially,
+    # after equidistancing, after truncating and after padding)
+    length_logs = np.empty((len(all_file_entries), 4), dtype=np.int32)
+
+    # Get the JSON key and the data type of each requested tightening value (once)
+    value_keys = {
+        value: (f"{value} values", np.float64 if value == "time" else DTYPE)
+        for value in tightening_values
+    }
+
+    # Get the requested cycles as set and steps as tuple for the checks in the loop
+    cycles_is_all = tightening_cycles == "all"
+    cycles_set = None if cycles_is_all else frozenset(tightening_cycles)
+    steps_tuple = tuple(tightening_steps)
+    graph_key = KN.graph
+
+    # Check once if warnings are logged at all (skipped in the loop otherwise)
+    warning_enabled = logging_enabled and logger.isEnabledFor(logging.WARNING)
+    warn = logger.warning
+
+    # Load the file contents from json concurrently (in the order of the file names)
+    # and keep only the required values of every file (or get them from the cache)
+    run_values = tuple(key for key, _ in value_keys.values())
+    if cache_enabled:
+        run_cache_path = get_cache_path(source_path, {"run_values": run_values})
+        all_files = iter_cached_runs(all_file_entries, run_values, run_cache_path)
+    else:  # Without the cache, the decoded files are not kept in memory either
+        all_files = iter_dicts_from_json(
+            [entry.path for entry in all_file_entries],
+            values=run_values,
+            cache_enabled=False,
+        )
+    # (the files first in zip, so that the iterator runs to its end and updates the cache)
+    for file, file_entry in tqdm(
+        zip(all_files, all_file_entries),
+        total=len(all_file_entries),
+        desc="Loading and preparing data: ",
+        disable=not verbose,
     ):
-        # Load file content from json
-        file = get_dict_from_json(source_path, file_name)
-
         # Extract required values from the file
         file_id = file.get(KN.id)
         file_label = file.get(KN.label)
@@ -126,143 +200,165 @@ def from_directory(
 
         # Skip files with missing key values
         if file_id is None or file_label is None or file_steps is None:
-            if logging_enabled:
-                logger.warning(f"Missing keys in file: {file_name}")
+            if warning_enabled:
+                warn("Missing keys in file: %s", file_entry.name)
             continue
 
         # Update the count of tightening cycles for the current file ID
-        all_cycle_counts[file_id] = all_cycle_counts.get(file_id, 0) + 1
+        cycle_count = all_cycle_counts.get(file_id, 0) + 1
+        all_cycle_counts[file_id] = cycle_count
 
         # Check if the current tightening cycle count is in the requested cycles
-        if all_cycle_counts[file_id] in tightening_cycles or tightening_cycles == "all":
-            # Initialize dictionary to store values for the current cycle
-            all_cycle_values = {k: [] for k in tightening_values}
-
-            # Iterate only the requested tightening steps
-            for step in [
-                file_steps[step_idx - 1]
-                for step_idx in tightening_steps
-                if step_idx <= len(file_steps)
-            ]:
-                # Add requested values to the cycle values dictionary
-                for value in tightening_values:
-                    all_cycle_values[value].extend(
-                        step[KN.graph].get(f"{value} values", [])
+        if cycles_is_all or cycle_count in cycles_set:
+            # Select only the requested tightening steps (once for all values)
+            num_of_steps = len(file_steps)
+            selected_graphs = [
+                file_steps[step_idx - 1][graph_key]
+                for step_idx in steps_tuple
+                if step_idx <= num_of_steps
+            ]
+
+            # Concatenate the requested values of the selected steps to one array per
+            # value type (float32, except for the time that defines the grid of the
+            # equidistancing), a single step is converted without the concatenation
+            if len(selected_graphs) == 1:
+                graph = selected_graphs[0]
+                all_cycle_values = {
+                    value: np.asarray(graph.get(key, ()), dtype)
+                    for value, (key, dtype) in value_keys.items()
+                }
+            else:
+                all_cycle_values = {
+                    value: np.concatenate(
+                        [
+                            np.asarray(graph.get(key, ()), dtype)
+                            for graph in selected_graphs
+                        ]
+                        or [np.empty(0, dtype)]
                     )
-
-            # Apply equidistancing if enabled
-            if equidistancing_enabled:
-                all_cycle_values, initial_length, final_length = apply_equidistancing(
-                    all_cycle_values
-                )
-                equidistancing_logs.append((initial_length, final_length))
-
-            # Apply truncating if target length and cutoff position are specified
-            if target_length is not None and cutoff_position is not None:
-                all_cycle_values, trunc_initial_lengths, trunc_final_lengths = (
-                    apply_truncating(all_cycle_values, target_length, cutoff_position)
-                )
-                truncating_logs.append((trunc_initial_lengths, trunc_final_lengths))
-
-            # Apply padding if padding value and position are specified
-            if padding_value is not None and padding_position is not None:
-                all_cycle_values, pad_initial_lengths, pad_final_lengths = (
-                    apply_padding(
-                        all_cycle_values, padding_value, padding_position, target_length
-                    )
-                )
-                padding_logs.append((pad_initial_lengths, pad_final_lengths))
-
-            # Append cycle values to the return values list
-            for i, value in enumerate(tightening_values):
-                return_values[i].append(all_cycle_values[value])
+                    for value, (key, dtype) in value_keys.items()
+                }
+
+            # Apply equidistancing, truncating and padding (if enabled) in a single pass
+            row = len(return_values[-1])
+            all_cycle_values, lengths = build_cycle(
+                all_cycle_values,
+                target_length=target_length,
+                interval_length=0.0012 if equidistancing_enabled else None,
+                padding_val=padding_value,
+                padding_pos=padding_position,
+                cutoff_pos=cutoff_position,
+                dtype=DTYPE,
+                out=cycles_buffer[:, row] if padding_enabled else None,
+            )
+            length_logs[row] = lengths
+
+            # Append the cycle values to the return values (already written with padding)
+            if not padding_enabled:
+                for i, value in enumerate(tightening_values):
+                    return_values[i].append(all_cycle_values[value])
 
             # Append the label to the return values list
             return_values[-1].append(file_label)
 
-    # Apply split_ratio
-    return_values = apply_split(return_values, split_ratio, split_seed)
+    # Trim the preallocated arrays to the number of loaded cycles (skipped files)
+    num_of_cycles = len(return_values[-1])
+    length_logs = length_logs[:num_of_cycles]
+    if padding_enabled:
+        return_values[:-1] = [values[:num_of_cycles] for values in return_values[:-1]]
+
+    # Apply split_ratio (the lengths after truncating are the lengths without padding)
+    cycle_lengths = length_logs[:, 2] if return_lengths else None
+    return_values = apply_split(
+        return_values, split_ratio, split_seed, lengths=cycle_lengths
+    )
+    if return_lengths:
+        num_of_splits = len(return_values) // 3
+        split_lengths = return_values[-num_of_splits:]
+        return_values = return_values[:-num_of_splits]
 
     # Apply conversion to the return values
-    return_values = apply_conversion(return_values, result_format, return_format)
+    return_values = apply_conversion(
+        return_values, result_format, return_format, dtype=DTYPE
+    )
 
     # Optionally log the metrics
     if logging_enabled:
         logger.info("Finished loading and preparing the data.")
+        # Only the lengths of the enabled steps are logged (no rows otherwise)
         log_metrics(
-            equidistancing_logs,
-            truncating_logs,
-            padding_logs,
+            length_logs[:, 0:2] if equidistancing_enabled else length_logs[:0, 0:2],
+            length_logs[:, 1:3] if truncating_enabled else length_logs[:0, 1:3],
+            length_logs[:, 2:4] if padding_enabled else length_logs[:0, 2:4],
             return_values,
             result_format,
             return_format,
         )
 
+    # Append the lengths of the cycles (in the return format)
+    if return_lengths:
+        return_values += [
+            lengths.tolist() if return_format == "nested_list" else lengths
+            for lengths in split_lengths
+        ]
+
     return return_values
 
 
 def log_metrics(
-    equidistancing_logs: List[Tuple[int, int]],
-    truncating_logs: List[Tuple[int, int]],
-    padding_logs: List[Tuple[int, int]],
+    equidistancing_logs: np.ndarray,
+    truncating_logs: np.ndarray,
+    padding_logs: np.ndarray,
     return_values: Any,
     result_format: str,
     return_format: str,
 ) -> None:
     """Log metrics for equidistancing, truncating, and padding."""
-    if equidistancing_logs:
-        average_initial_length = sum(length[0] for length in equidistancing_logs) / len(
-            equidistancing_logs
-        )
-        average_final_length = sum(length[1] for length in equidistancing_logs) / len(
-            equidistancing_logs
-        )
-        logger.info(
-            f"- Equidistancing results (avg. lengths): {average_initial_length:.2f} -> {average_final_length:.2f}"
-        )
-
-    if truncating_logs:
-        average_initial_length = sum(length[0] for length in truncating_logs) / len(
-            truncating_logs
-        )
-        average_final_length = sum(length[1] for length in truncating_logs) / len(
-            truncating_logs
-        )
-        logger.info(
-            f"- Truncating results (avg. lengths): {average_initial_length:.2f} -> {average_final_length:.2f}"
-        )
-
-    if padding_logs:
-        average_initial_length = sum(length[0] for length in padding_logs) / len(
-            padding_logs
-        )
-        average_final_length = sum(length[1] for length in padding_logs) / len(
-            padding_logs
-        )
-        logger.info(
-            f"- Padding results (avg. lengths): {average_initial_length:.2f} -> {average_final_length:.2f}"
-        )
-
-    if isinstance(return_values, tuple) and len(return_values) == 4:
+    for name, logs in (
+        ("Equidistancing", equidistancing_logs),
+        ("Truncating", truncating_logs),
+        ("Padding", padding_logs),
+    ):
+        # The logs are arrays of (initial length, final length), one row per cycle
+        if len(logs):
+            average_initial_length, average_final_length = logs.mean(axis=0)
+            logger.info(
+                "- %s results (avg. lengths): %.2f -> %.2f",
+                name,
+                average_initial_length,
+                average_final_length,
+            )
+
+    # The converted data is a list (x_train, x_test, y_train, y_test) after splitting
+    if len(return_values) == 4:
         x_train, x_test, y_train, y_test = return_values
         logger.info(
-            f"Training data count: {len(x_train[0])}, Testing data count: {len(x_test[0])}"
+            "Training data count: %d, Testing data count: %d",
+            len(x_train[0]),
+            len(x_test[0]),
         )
 
         if result_format == "binary":
-            train_labels = y_train
-            test_labels = y_test
+            train_labels = np.asarray(y_train, dtype=np.int64)
+            test_labels = np.asarray(y_test, dtype=np.int64)
         else:  # result_format == "raw"
-            train_labels = [1 if label == "NOK" else 0 for label in y_train]
-            test_labels = [1 if label == "NOK" else 0 for label in y_test]
+            train_labels = convert_to_binary(y_train)
+            test_labels = convert_to_binary(y_test)
 
+        # Count both binary labels (0 for "OK", 1 for "NOK") in a single pass each
+        train_counts = np.bincount(train_labels, minlength=2)
+        test_counts = np.bincount(test_labels, minlength=2)
         logger.info(
-            f"Training labels - 0 count: {train_labels.count(0)}, 1 count: {train_labels.count(1)}"
+            "Training labels - 0 count: %d, 1 count: %d",
+            train_counts[0],
+            train_counts[1],
         )
         logger.info(
-            f"Testing labels - 0 count: {test_labels.count(0)}, 1 count: {test_labels.count(1)}"
+            "Testing labels - 0 count: %d, 1 count: %d",
+            test_counts[0],
+            test_counts[1],
         )
 
     if return_format == "numpy_array":
         for i, array in enumerate(return_values):
-            logger.info(f"Array {i} shape: {array.shape}")
+            logger.info("Array %d shape: %s", i, array.shape)
@@ -12,6 +12,7 @@ def get_logger(
     backup_count: int = 5,
     when: str = "midnight",
     interval: int = 1,
+    console: bool = True,
 ) -> logging.Logger:
     """
     Returns a logger with the specified name, log file, logging level,
@@ -34,6 +35,8 @@ def get_logger(
             Interval type for time-based rotation (e.g., 'midnight', 'D', 'H', 'M').
         interval (int):
             Interval of rotation for time-based rotation.
+        console (bool):
+            Also print the log messages to the console (stderr).
 
     Returns:
         logging.Logger: Configured logger.
@@ -57,17 +60,17 @@ def get_logger(
     else:
         raise ValueError(f"Invalid rotation_type: {rotation_type}")
 
-    stream_handler = logging.StreamHandler()
-
     # Create formatter and add it to handlers
     formatter = logging.Formatter(
         "%(asctime)s - %(name)s - %(levelname)s - %(message)s"
     )
     file_handler.setFormatter(formatter)
-    stream_handler.setFormatter(formatter)
-
-    # Add handlers to the logger
     logger.addHandler(file_handler)
-    logger.addHandler(stream_handler)
+
+    # Optionally add a console handler (every message is written to stderr)
+    if console:
+        stream_handler = logging.StreamHandler()
+        stream_handler.setFormatter(formatter)
+        logger.addHandler(stream_handler)
 
     return logger
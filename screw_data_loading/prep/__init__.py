@@ -4,3 +4,4 @@ from .truncating import apply_truncating
 from .converting import apply_conversion
 from .equidistancing import apply_equidistancing
 from .validating import validate_parameter
+from ._fused import build_cycle
@@ -0,0 +1,162 @@
+# _fused.py
+
+from typing import Dict, Optional, Tuple
+
+import numpy as np
+
+from .equidistancing import (
+    average_duplicates,
+    get_time_grid,
+    get_unique_times,
+    interp_channels,
+)
+from .padding import get_time_axis
+
+
+def build_cycle(
+    cycle_values: Dict[str, np.ndarray],
+    target_length: Optional[int] = None,
+    interval_length: Optional[float] = 0.0012,
+    padding_val: Optional[float] = None,
+    padding_pos: Optional[str] = None,
+    cutoff_pos: Optional[str] = None,
+    dtype: type = np.float64,
+    out: Optional[np.ndarray] = None,
+) -> Tuple[Dict[str, np.ndarray], Tuple[int, int, int, int]]:
+    """
+    Apply equidistancing, truncating and padding to the given cycle values in one pass.
+
+    The result is the same as calling `apply_equidistancing`, `apply_truncating` and
+    `apply_padding` one after another, but all values are written once into a single
+    preallocated array (one row per value type) instead of allocating new arrays in every
+    step. Only the points of the equidistant time grid that are kept after truncating are
+    interpolated.
+
+    Parameters
+    ----------
+    cycle_values : Dict[str, np.ndarray]
+        A dictionary containing cycle values. The keys represent the value types, and the
+        values are arrays of values. The "time" key is used as the index.
+    target_length : Optional[int], optional
+        The length to truncate and pad to. Defaults to None.
+    interval_length : Optional[float], optional
+        The interval length for equidistancing, or None to skip the equidistancing.
+        Defaults to 0.0012.
+    padding_val : Optional[float], optional
+        The value to use for padding, or None to skip the padding. Defaults to None.
+    padding_pos : Optional[str], optional
+        Position to apply padding ('pre' or 'post'), or None to skip the padding.
+        Defaults to None.
+    cutoff_pos : Optional[str], optional
+        Position to apply truncating ('pre' or 'post'), or None to skip the truncating.
+        Defaults to None.
+    dtype : type, optional
+        The data type of the returned arrays. Defaults to np.float64.
+    out : Optional[np.ndarray], optional
+        A 2-D array (or view) of shape (rows, target_length) to write the padded values
+        into, e.g. the rows of a cycle in a preallocated array of all cycles. The rows
+        are the values in the order of cycle_values with the time last (the time row may
+        be left out). Only supported if padding is applied. Defaults to None, where a new
+        array is allocated.
+
+    Returns
+    -------
+    Tuple[Dict[str, np.ndarray], Tuple[int, int, int, int]]
+        A tuple containing the following:
+        - A dictionary with the processed cycle values (rows of one 2-D array).
+        - The lengths of the values initially, after equidistancing, after truncating and
+          after padding (unchanged lengths for skipped steps).
+
+    Examples
+    --------
+    >>> cycle_values = {
+    >>>     "time": np.array([0.0, 0.1, 0.2, 0.3]),
+    >>>     "torque": np.array([10, 20, 30, 40])
+    >>> }
+    >>> values, lengths = build_cycle(cycle_values, 5, 0.1, 0, "pre", "post")
+    >>> print(values)
+    >>> print(f"Lengths: {lengths}")
+    """
+    # Determine the initial length of the cycle values
+    initial_length = len(next(iter(cycle_values.values())))
+
+    # Get the equidistant time grid (always computed in float64, see apply_equidistancing)
+    if interval_length is not None:
+        time_values = np.asarray(cycle_values["time"], dtype=np.float64)
+        unique_times, order, starts, counts = get_unique_times(time_values)
+        full_time_range = get_time_grid(
+            unique_times.min(), unique_times.max(), interval_length
+        )
+    else:  # Keep the positions of the values without equidistancing
+        full_time_range = cycle_values.get("time", np.arange(initial_length))
+    equidistant_length = len(full_time_range)
+
+    # Get the slice of the time grid that remains after truncating
+    if target_length is not None and cutoff_pos is not None:
+        if cutoff_pos == "pre":
+            kept = slice(max(equidistant_length - target_length, 0), None)
+        else:
+            kept = slice(0, target_length)
+    else:
+        kept = slice(None)
+    kept_time_range = full_time_range[kept]
+    truncated_length = len(kept_time_range)
+
+    # Allocate all rows at once (filled with the padding value if padding is applied):
+    # the values first (as one contiguous block) and the time last, which is always
+    # returned after padding
+    padding_enabled = padding_val is not None and padding_pos is not None
+    value_keys = [key for key in cycle_values if key != "time"]
+    if padding_enabled:
+        if target_length is None or truncated_length > target_length:
+            raise ValueError(
+                f"Cannot pad {truncated_length} values to target length {target_length}."
+            )
+        if padding_pos == "pre":
+            valid = slice(target_length - truncated_length, None)
+            padded = slice(0, target_length - truncated_length)
+        else:
+            valid = slice(0, truncated_length)
+            padded = slice(truncated_length, None)
+        if out is None:
+            out = np.full(
+                (len(value_keys) + 1, target_length), padding_val, dtype=dtype
+            )
+        else:  # Fill only the padded positions of the provided rows
+            out[:, padded] = padding_val
+    elif out is not None:
+        raise ValueError("An output array is only supported if padding is applied.")
+    else:
+        num_of_rows = len(value_keys) + ("time" in cycle_values)
+        out = np.empty((num_of_rows, truncated_length), dtype=dtype)
+        valid = slice(None)
+    num_of_rows = len(out)
+    padded_length = out.shape[1]
+
+    # Write the (interpolated) values directly into their rows (a view of the output)
+    value_rows = out[: len(value_keys), valid]
+    if interval_length is not None:
+        mean_values = [
+            average_duplicates(cycle_values[key], order, starts, counts, dtype)
+            for key in value_keys
+        ]
+        interp_channels(kept_time_range, unique_times, mean_values, out=value_rows)
+    else:
+        for row, key in zip(value_rows, value_keys):
+            row[:] = np.asarray(cycle_values[key])[kept]
+
+    # Write the time (overwritten to match the new length if padding is applied)
+    if num_of_rows > len(value_keys):
+        if padding_enabled:
+            out[-1] = get_time_axis(padded_length, out.dtype)
+        else:
+            out[-1] = kept_time_range
+
+    # Return the rows by value type (in the order of the provided values)
+    processed_values = dict(zip(value_keys, out))
+    if num_of_rows > len(value_keys):
+        processed_values = {
+            key: processed_values.get(key, out[-1]) for key in [*cycle_values, "time"]
+        }
+    lengths = (initial_length, equidistant_length, truncated_length, padded_length)
+    return processed_values, lengths
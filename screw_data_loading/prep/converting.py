@@ -4,7 +4,7 @@ import numpy as np
 
 
 def apply_conversion(
-    data: List[Any], result_format: str, return_format: str
+    data: List[Any], result_format: str, return_format: str, dtype: type = None
 ) -> Union[List[Any], List[np.ndarray]]:
     """
     Apply conversion to the given data based on the specified result and return formats.
@@ -17,6 +17,9 @@ def apply_conversion(
         The format for the result values. Can be 'binary' or 'raw'.
     return_format : str
         The format for the returned data. Can be 'numpy_array' or 'nested_list'.
+    dtype : type, optional
+        The data type of the measurement arrays if return_format is 'numpy_array' (e.g.
+        np.float32). Defaults to None, where NumPy infers the data type.
 
     Returns
     -------
@@ -41,6 +44,9 @@ def apply_conversion(
     >>> converted_data = apply_conversion(data, result_format="binary", return_format="numpy_array")
     >>> print(converted_data)
     """
+    # Copy the data to a list, since the split data is returned as tuple
+    data = list(data)
+
     # Apply result format conversion
     if result_format == "binary":
         # If data is in the format of x_train, x_test, y_train, y_test
@@ -54,14 +60,50 @@ def apply_conversion(
 
     # Apply return format conversion
     if return_format == "numpy_array":
-        return [np.array(d) for d in data]
+        # The last half of the data are the results, all others are measurements
+        num_of_measurements = len(data) // 2
+        return [
+            np.asarray(d, dtype=dtype if i < num_of_measurements else None)
+            for i, d in enumerate(data)
+        ]
     elif return_format == "nested_list":
-        return data
+        # Return the binary results and the measurement arrays as lists as well: the
+        # measurements are (lists of) arrays per type of value and the results are flat
+        # (all converted in C with tolist, not element-wise)
+        num_of_measurements = len(data) // 2
+        return [
+            to_nested_list(d, depth=3 if i < num_of_measurements else 1)
+            for i, d in enumerate(data)
+        ]
     else:
         raise ValueError(f"Unsupported return format: {return_format = }.")
 
 
-def convert_to_binary(data: List[str]) -> List[int]:
+def to_nested_list(data: Any, depth: int) -> Any:
+    """
+    Convert arrays in (nested) lists of the given depth to lists.
+
+    Parameters
+    ----------
+    data : Any
+        An array or a list (of lists) whose entries at the given depth are arrays.
+    depth : int
+        The number of list levels (e.g. 3 for a list per value type of lists of arrays
+        per cycle, where 2-D arrays at the second level are converted as a whole).
+
+    Returns
+    -------
+    Any
+        The data as nested lists.
+    """
+    if isinstance(data, np.ndarray):
+        return data.tolist()
+    if depth <= 1:
+        return data
+    return [to_nested_list(d, depth - 1) for d in data]
+
+
+def convert_to_binary(data: List[str]) -> np.ndarray:
     """
     Convert result values to binary format.
 
@@ -72,8 +114,8 @@ def convert_to_binary(data: List[str]) -> List[int]:
 
     Returns
     -------
-    List[int]
-        The converted binary data.
+    np.ndarray
+        The converted binary data (as int8).
 
     Examples
     --------
@@ -81,4 +123,5 @@ def convert_to_binary(data: List[str]) -> List[int]:
     >>> binary_data = convert_to_binary(data)
     >>> print(binary_data)
     """
-    return [1 if x == "NOK" else 0 for x in data]
+    # Compare all results at once instead of branching per element in Python
+    return (np.asarray(data, dtype=str) == "NOK").astype(np.int8)
@@ -1,5 +1,7 @@
 # equidistancing.py
-from typing import Any, Dict, List, Tuple
+import math
+from functools import lru_cache
+from typing import Any, Dict, List, Optional, Tuple
 
 import numpy as np
 
@@ -7,6 +9,7 @@ import numpy as np
 def apply_equidistancing(
     cycle_values: Dict[str, List[Any]],
     interval_length: float = 0.0012,
+    dtype: type = np.float64,
 ) -> Tuple[Dict[str, np.ndarray], int, int]:
     """
     Apply equidistancing to the given cycle values.
@@ -18,6 +21,9 @@ def apply_equidistancing(
         and the values are lists of values. The "time" key is used as the index.
     interval_length : float, optional
         The desired interval length for equidistancing. Defaults to 0.0012.
+    dtype : type, optional
+        The data type of the returned arrays (e.g. np.float32 to halve their size).
+        Defaults to np.float64.
 
     Returns
     -------
@@ -38,34 +44,193 @@ def apply_equidistancing(
     >>> print(equidistant_values)
     >>> print(f"Initial length: {initial_len}, Final length: {final_len}")
     """
-    # Extracting time values and determining the initial length
-    time_values = np.array(cycle_values["time"])
+    # Extracting time values and determining the initial length (the time grid is always
+    # computed in float64, since rounding can change the number of equidistant points)
+    time_values = np.asarray(cycle_values["time"], dtype=np.float64)
     initial_length = len(time_values)
 
     # Removing duplicates in 'time' by averaging the values
-    unique_times, unique_indices = np.unique(time_values, return_index=True)
-    full_time_range = np.arange(
-        unique_times.min(), unique_times.max() + interval_length, interval_length
+    unique_times, order, starts, counts = get_unique_times(time_values)
+    full_time_range = get_time_grid(
+        unique_times.min(), unique_times.max(), interval_length
     )
 
     # Creating the mean values for unique times
     mean_values_dict = {
-        key: np.array(values)[unique_indices]
+        key: average_duplicates(values, order, starts, counts, dtype)
         for key, values in cycle_values.items()
         if key != "time"
     }
 
-    # Dictionary to store equidistant cycle values
-    equidistant_cycle_values = {}
+    # Interpolating all values at once to fit the equidistant time intervals
+    interpolated_values = interp_channels(
+        full_time_range, unique_times, list(mean_values_dict.values())
+    ).astype(dtype, copy=False)
 
-    # Interpolating values to fit the equidistant time intervals
-    for key, mean_values in mean_values_dict.items():
-        interpolated_values = np.interp(full_time_range, unique_times, mean_values)
-        equidistant_cycle_values[key] = interpolated_values
+    # Dictionary to store equidistant cycle values
+    equidistant_cycle_values = dict(zip(mean_values_dict, interpolated_values))
 
-    # Store the full time range in the dictionary
-    equidistant_cycle_values["time"] = full_time_range
+    # Store the full time range in the dictionary (a copy of the shared time grid)
+    equidistant_cycle_values["time"] = full_time_range.astype(dtype)
     final_length = len(full_time_range)
 
     # Return the equidistant cycle values and the lengths before and after equidistancing
     return equidistant_cycle_values, initial_length, final_length
+
+
+def get_time_grid(start: float, end: float, interval_length: float) -> np.ndarray:
+    """
+    Get the equidistant time grid from start to end (the same as `np.arange`).
+
+    The grid only depends on its start, interval and length, and most cycles start at
+    the same time (e.g. 0). Instead of computing the grid of every cycle, a grid of the
+    next power of two of its length is computed once per start and interval (see
+    `_get_time_grid`) and a view of its first values is returned. The values are the
+    same as `np.arange(start, end + interval_length, interval_length)`.
+
+    Parameters
+    ----------
+    start : float
+        The first time of the grid (e.g. the first unique time of a cycle).
+    end : float
+        The last time to cover (e.g. the last unique time of a cycle).
+    interval_length : float
+        The interval length of the grid.
+
+    Returns
+    -------
+    np.ndarray
+        The (read-only) equidistant times in float64.
+    """
+    start, interval_length = float(start), float(interval_length)
+    length = max(math.ceil((float(end) + interval_length - start) / interval_length), 0)
+    capacity = 1 << (length - 1).bit_length() if length > 1 else 1
+    return _get_time_grid(start, interval_length, capacity)[:length]
+
+
+@lru_cache(maxsize=32)
+def _get_time_grid(start: float, interval_length: float, capacity: int) -> np.ndarray:
+    """
+    Compute the equidistant time grid with the given number of values (in float64).
+
+    The values are computed as by `np.arange` (start plus the index times the rounded
+    interval), so any prefix of the grid equals the grid of a shorter range. The returned
+    array is shared and hence read-only.
+    """
+    delta = (start + interval_length) - start
+    time_grid = start + np.arange(capacity) * delta
+    time_grid.flags.writeable = False
+    return time_grid
+
+
+def get_unique_times(
+    time_values: np.ndarray,
+) -> Tuple[np.ndarray, np.ndarray, np.ndarray, np.ndarray]:
+    """
+    Sort the time values and find the groups of equal (duplicate) times.
+
+    Parameters
+    ----------
+    time_values : np.ndarray
+        The time values of a cycle (not necessarily sorted or unique).
+
+    Returns
+    -------
+    Tuple[np.ndarray, np.ndarray, np.ndarray, np.ndarray]
+        A tuple containing the following:
+        - The sorted unique times.
+        - The (stable) order that sorts the time values.
+        - The index of the first sorted value of every unique time.
+        - The number of values of every unique time.
+    """
+    order = np.argsort(time_values, kind="stable")
+    sorted_times = time_values[order]
+    starts = np.flatnonzero(np.diff(sorted_times, prepend=-np.inf))
+    counts = np.diff(starts, append=len(sorted_times))
+    return sorted_times[starts], order, starts, counts
+
+
+def average_duplicates(
+    values: List[Any],
+    order: np.ndarray,
+    starts: np.ndarray,
+    counts: np.ndarray,
+    dtype: type = np.float64,
+) -> np.ndarray:
+    """
+    Average the values of duplicate times in a single pass (see `get_unique_times`).
+
+    Parameters
+    ----------
+    values : List[Any]
+        The values of a cycle (in the order of the time values).
+    order : np.ndarray
+        The order that sorts the time values.
+    starts : np.ndarray
+        The index of the first sorted value of every unique time.
+    counts : np.ndarray
+        The number of values of every unique time.
+    dtype : type, optional
+        The data type of the returned array. Defaults to np.float64.
+
+    Returns
+    -------
+    np.ndarray
+        The mean value of every unique time.
+    """
+    sorted_values = np.asarray(values, dtype=dtype)[order]
+    # Without duplicates, every value is its own mean
+    if len(starts) == len(sorted_values):
+        return sorted_values
+    return (np.add.reduceat(sorted_values, starts) / counts).astype(dtype, copy=False)
+
+
+def interp_channels(
+    x: np.ndarray,
+    xp: np.ndarray,
+    fps: List[np.ndarray],
+    out: Optional[np.ndarray] = None,
+) -> np.ndarray:
+    """
+    Linearly interpolate several value arrays at the same points (like `np.interp`).
+
+    Calling `np.interp` once per value type repeats the binary search of x in xp every
+    time. Here, the search and the interpolation weights are computed once and applied
+    to all value arrays at once, in the precision of the values (e.g. float32).
+
+    Parameters
+    ----------
+    x : np.ndarray
+        The points to evaluate the interpolated values at.
+    xp : np.ndarray
+        The increasing points of the values (e.g. the unique times).
+    fps : List[np.ndarray]
+        The value arrays (each of the same length as xp).
+    out : Optional[np.ndarray], optional
+        A 2-D array (or view) of shape (len(fps), len(x)) to write the interpolated values
+        into, instead of allocating a new array. Defaults to None.
+
+    Returns
+    -------
+    np.ndarray
+        A 2-D array with one row of interpolated values per value array (values outside
+        of xp are clamped to the first or last value, as with `np.interp`).
+    """
+    values = np.asarray(fps).reshape(len(fps), len(xp))
+    if not np.issubdtype(values.dtype, np.floating):
+        values = values.astype(np.float64)
+    if out is None:
+        out = np.empty((len(fps), len(x)), dtype=values.dtype)
+    if len(xp) == 1:
+        out[...] = values
+        return out
+    # Index of the right neighbor of every point and its (clamped) weight
+    right = np.clip(np.searchsorted(xp, x, side="right"), 1, len(xp) - 1)
+    left_x, right_x = xp[right - 1], xp[right]
+    weights = np.clip((x - left_x) / (right_x - left_x), 0, 1)
+    # Compute left + weight * (right - left) in place, with only two temporary arrays
+    left_values = values[:, right - 1]
+    deltas = values[:, right]
+    np.subtract(deltas, left_values, out=deltas)
+    np.multiply(deltas, weights, out=deltas, casting="same_kind")
+    return np.add(left_values, deltas, out=out, casting="same_kind")
@@ -1,35 +1,46 @@
 # padding.py
 
-from typing import Any, Dict, List, Tuple
+from functools import lru_cache
+from typing import Any, Dict, List, Optional, Tuple, Union
 
 import numpy as np
 
 
 def apply_padding(
-    cycle_values: Dict[str, List[Any]],
+    cycle_values: Union[Dict[str, List[Any]], np.ndarray],
     padding_val: float,
     padding_pos: str,
     target_length: int,
-) -> Tuple[Dict[str, np.ndarray], int, int]:
+    dtype: type = np.float64,
+    out: Optional[np.ndarray] = None,
+) -> Tuple[Union[Dict[str, np.ndarray], np.ndarray], int, int]:
     """
     Apply padding to the given cycle values.
 
     Parameters
     ----------
-    cycle_values : Dict[str, List[Any]]
+    cycle_values : Union[Dict[str, List[Any]], np.ndarray]
         A dictionary containing cycle values, where the keys represent the value types
-        and the values are lists of corresponding values.
+        and the values are lists of corresponding values, or a 2-D array with one row per
+        value type (all rows are padded, there is no time to overwrite).
     padding_val : float
         The value to use for padding.
     padding_pos : str
         Position to apply padding ('pre' or 'post').
     target_length : int
         The target length of the sequences after padding.
+    dtype : type, optional
+        The data type of the returned arrays. Defaults to np.float64.
+    out : Optional[np.ndarray], optional
+        A 2-D array (or view) of shape (len(cycle_values), target_length) to pad into,
+        e.g. the rows of a cycle in a preallocated array of all cycles. The data type of
+        `out` is used instead of dtype. Defaults to None, where a new array is allocated.
 
     Returns
     -------
-    Tuple[Dict[str, np.ndarray], int, int]
-        A tuple containing the dictionary with padded cycle values, the initial length, and the final length.
+    Tuple[Union[Dict[str, np.ndarray], np.ndarray], int, int]
+        A tuple containing the padded cycle values (as dictionary or 2-D array, like the
+        provided values), the initial length, and the final length.
 
     Examples
     --------
@@ -42,31 +53,83 @@ def apply_padding(
     >>> print(f"Initial length: {initial_len}, Final length: {final_len}")
     """
     # Determine the initial length of the cycle values
-    initial_length = len(next(iter(cycle_values.values())))
+    if isinstance(cycle_values, np.ndarray):
+        initial_length = cycle_values.shape[1]
+    else:
+        initial_length = len(next(iter(cycle_values.values())))
 
-    def pad_sequence(
-        seq: List[Any], target_length: int, padding_val: float, padding_pos: str
-    ) -> np.ndarray:
-        """Pad a sequence to the target length with the specified padding value and position."""
-        pad_len = target_length - len(seq)
+    # Allocate all padded sequences at once (unless provided), one row per value type
+    if out is None:
+        padded = np.empty((len(cycle_values), target_length), dtype=dtype)
+    else:
+        padded = out
+
+    # Pad all rows of an array at once (all sequences have the same length): copy the
+    # values and fill only the remaining values with the padding value
+    if isinstance(cycle_values, np.ndarray):
+        pad_length = target_length - initial_length
+        if pad_length < 0:
+            raise ValueError(
+                f"Cannot pad {initial_length} values to target length {target_length}."
+            )
         if padding_pos == "pre":
-            return np.pad(seq, (pad_len, 0), "constant", constant_values=padding_val)
+            padded[:, :pad_length] = padding_val
+            padded[:, pad_length:] = cycle_values
         else:
-            return np.pad(seq, (0, pad_len), "constant", constant_values=padding_val)
+            padded[:, initial_length:] = padding_val
+            padded[:, :initial_length] = cycle_values
+        return padded, initial_length, target_length
 
-    # Apply padding to each value type in the cycle values
-    padded_sequences = {
-        k: pad_sequence(v, target_length, padding_val, padding_pos)
-        for k, v in cycle_values.items()
-    }
+    # Copy every sequence into its row with a single slice assignment (a memory copy
+    # for arrays) and fill only the remaining values with the padding value
+    for row, seq in zip(padded, cycle_values.values()):
+        pad_length = target_length - len(seq)
+        if pad_length < 0:
+            raise ValueError(
+                f"Cannot pad {len(seq)} values to target length {target_length}."
+            )
+        if padding_pos == "pre":
+            row[:pad_length] = padding_val
+            row[pad_length:] = seq
+        else:
+            row[target_length - pad_length :] = padding_val
+            row[: target_length - pad_length] = seq
+    padded_sequences = dict(zip(cycle_values.keys(), padded))
 
-    # Overwrite the time to match the new length
-    padded_sequences["time"] = np.linspace(
-        0, (target_length - 1) * 0.0012, target_length
-    )
+    # Overwrite the time to match the new length (shared read-only array, or written
+    # into its row of the provided array)
+    if out is not None and "time" in padded_sequences:
+        padded_sequences["time"][:] = get_time_axis(target_length, out.dtype)
+    else:
+        padded_sequences["time"] = get_time_axis(target_length, dtype)
 
     # Determine the final length of the padded cycle values
     final_length = len(next(iter(padded_sequences.values())))
 
     # Return the padded cycle values along with the initial and final lengths
     return padded_sequences, initial_length, final_length
+
+
+@lru_cache(maxsize=8)
+def get_time_axis(length: int, dtype: type = np.float64) -> np.ndarray:
+    """
+    Get the equidistant time of padded values (in steps of 0.0012 starting at 0).
+
+    The target length is the same for all cycles of a load, so the time is computed only
+    once per length and data type. The returned array is shared and hence read-only.
+
+    Parameters
+    ----------
+    length : int
+        The number of time values.
+    dtype : type, optional
+        The data type of the time values. Defaults to np.float64.
+
+    Returns
+    -------
+    np.ndarray
+        The (read-only) time values.
+    """
+    time_axis = np.linspace(0, (length - 1) * 0.0012, length, dtype=dtype)
+    time_axis.flags.writeable = False
+    return time_axis
@@ -1,15 +1,16 @@
 # splitting.py
 
-import random
+from operator import itemgetter
 from typing import Any, List, Optional, Tuple, Union
 
 import numpy as np
 
 
 def apply_split(
-    data: List[List[Any]],
+    data: Union[List[List[Any]], np.ndarray],
     split_ratio: float,
     split_seed: Optional[int] = None,
+    lengths: Optional[np.ndarray] = None,
 ) -> Union[
     Tuple[List[Any], List[Any], List[Any], List[Any]],
     Tuple[List[Any], List[Any]],
@@ -19,18 +20,24 @@ def apply_split(
 
     Parameters
     ----------
-    data : List[List[Any]]
-        The data to split. Each sublist represents a type of measurement.
+    data : Union[List[List[Any]], np.ndarray]
+        The data to split. Each sublist represents a type of measurement, the last one the
+        results. A 2-D array (one row per type) is split into arrays. The results are
+        always returned as arrays.
     split_ratio : float
         The ratio for the training set. Should be between 0 and 1.
     split_seed : Optional[int], optional
         The random seed for reproducibility. Defaults to None.
+    lengths : Optional[np.ndarray], optional
+        The lengths of the entries (e.g. of the cycles without padding), split in the same
+        way as the data and appended to the returned tuple. Defaults to None.
 
     Returns
     -------
     Union[Tuple[List[Any], List[Any], List[Any], List[Any]], Tuple[List[Any], List[Any]]]
         If split_ratio is defined, returns (x_train, x_test, y_train, y_test).
         If split_ratio is None, returns (x_values, y_values).
+        If lengths are provided, (lengths_train, lengths_test) or (lengths,) is appended.
 
     Examples
     --------
@@ -44,58 +51,115 @@ def apply_split(
     >>> print(f"x_train: {x_train}, x_test: {x_test}, y_train: {y_train}, y_test: {y_test}")
     """
 
-    if split_seed is not None:
-        random.seed(split_seed)
-
     # Determine the length of the data
     data_length = len(data[0])
 
-    # Generate shuffled indices
-    indices = list(range(data_length))
-    random.shuffle(indices)
+    # Generate shuffled indices with a (seeded) NumPy generator instead of shuffling a
+    # Python list of indices with the global random state
+    rng = np.random.default_rng(split_seed)
+    indices = rng.permutation(data_length)
 
-    # Shuffle the data according to the shuffled indices
-    shuffled_data = [[values[i] for i in indices] for values in data]
-
-    # Flatten the data
-    flattened_data = flatten(shuffled_data)
+    # The results are gathered as one array (of their own data type, e.g. strings before
+    # the conversion to binary) instead of a list of Python objects
+    results = np.asarray(data[-1])
 
     # Split the data into training and testing sets
     if split_ratio is not None and 0 < split_ratio < 1:
+        # Only the index array is split, each set is gathered once from the data
         split_index = int(data_length * split_ratio)
-        training_data = [values[:split_index] for values in flattened_data]
-        testing_data = [values[split_index:] for values in flattened_data]
+        training_indices = indices[:split_index]
+        testing_indices = indices[split_index:]
 
         # Return the training and testing sets
-        return (
-            training_data[:-1],  # x_train
-            testing_data[:-1],  # x_test
-            training_data[-1],  # y_train
-            testing_data[-1],  # y_test
+        split_data = (
+            take_measurements(data[:-1], training_indices),  # x_train
+            take_measurements(data[:-1], testing_indices),  # x_test
+            results[training_indices],  # y_train
+            results[testing_indices],  # y_test
         )
+        if lengths is not None:
+            split_data += (lengths[training_indices], lengths[testing_indices])
     else:
-        # Return the entire data as x_values and y_values
-        return flattened_data[:-1], flattened_data[-1]
+        # Return the entire (shuffled) data as x_values and y_values
+        split_data = (
+            take_measurements(data[:-1], indices),
+            results[indices],
+        )
+        if lengths is not None:
+            split_data += (lengths[indices],)
+    return split_data
+
+
+def take_measurements(
+    data: Union[List[List[Any]], np.ndarray], indices: np.ndarray
+) -> Union[List[List[Any]], np.ndarray]:
+    """
+    Select the entries at the given indices from every type of measurement.
+
+    If all types of measurement are arrays of the same shape and data type (e.g. after
+    padding), the entries are gathered directly into a single array with one row per
+    type of measurement, so that converting them to an array later on does not copy
+    them again. Otherwise, this is the same as `take`.
 
+    Parameters
+    ----------
+    data : Union[List[List[Any]], np.ndarray]
+        The data to select from. Each sublist (or row) represents a type of measurement.
+    indices : np.ndarray
+        The integer indices of the entries to select.
 
-def flatten(data: List[List[Any]]) -> List[List[Any]]:
+    Returns
+    -------
+    Union[List[List[Any]], np.ndarray]
+        The selected data, as array of shape (len(data), len(indices), ...) for arrays
+        of the same shape and data type.
     """
-    Flatten nested lists within the data.
+    # An array of all types of measurement is gathered at once
+    if isinstance(data, np.ndarray) and data.ndim > 1:
+        return data[:, indices]
+    first = data[0] if len(data) else None
+    if not isinstance(first, np.ndarray) or not all(
+        isinstance(values, np.ndarray)
+        and values.shape == first.shape
+        and values.dtype == first.dtype
+        for values in data
+    ):
+        return take(data, indices)
+    selected = np.empty((len(data), len(indices), *first.shape[1:]), first.dtype)
+    for row, values in zip(selected, data):
+        np.take(values, indices, axis=0, out=row)
+    return selected
+
+
+def take(data: List[List[Any]], indices: np.ndarray) -> List[List[Any]]:
+    """
+    Select the entries at the given indices from every type of measurement.
 
     Parameters
     ----------
     data : List[List[Any]]
-        The data to flatten.
+        The data to select from. Each sublist represents a type of measurement.
+    indices : np.ndarray
+        The integer indices of the entries to select.
 
     Returns
     -------
     List[List[Any]]
-        The flattened data.
+        The selected data (arrays are indexed directly, lists are gathered).
     """
-    return [
-        [
-            array.tolist() if isinstance(array, np.ndarray) else array
-            for array in sublist
+    # Arrays are indexed with the index array (in C), lists with an itemgetter of all
+    # indices, which gathers the entries in C as well (instead of a list comprehension)
+    if len(indices) == 0:
+        return [
+            values[indices] if isinstance(values, np.ndarray) else [] for values in data
         ]
-        for sublist in data
+    gather = itemgetter(*indices.tolist())
+    if len(indices) == 1:
+        return [
+            values[indices] if isinstance(values, np.ndarray) else [gather(values)]
+            for values in data
+        ]
+    return [
+        values[indices] if isinstance(values, np.ndarray) else list(gather(values))
+        for values in data
     ]
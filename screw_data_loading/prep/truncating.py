@@ -1,21 +1,24 @@
 # truncating.py
 
-from typing import Dict, List, Any, Tuple
+from typing import Dict, List, Any, Tuple, Union
+
+import numpy as np
 
 
 def apply_truncating(
-    cycle_values: Dict[str, List[Any]],
+    cycle_values: Union[Dict[str, List[Any]], np.ndarray],
     target_length: int,
     cutoff_position: str,
-) -> Tuple[Dict[str, List[Any]], int, int]:
+) -> Tuple[Union[Dict[str, List[Any]], np.ndarray], int, int]:
     """
     Apply truncating to the given cycle values.
 
     Parameters
     ----------
-    cycle_values : Dict[str, List[Any]]
+    cycle_values : Union[Dict[str, List[Any]], np.ndarray]
         A dictionary containing cycle values, where the keys represent the value types
-        and the values are lists of corresponding values.
+        and the values are lists (or arrays) of corresponding values. Alternatively, a
+        2-D array with one row per value type.
     target_length : int
         The index to truncate to.
     cutoff_position : str
@@ -23,8 +26,11 @@ def apply_truncating(
 
     Returns
     -------
-    Tuple[Dict[str, List[Any]], int, int]
-        A tuple containing the dictionary with truncated cycle values, the initial length, and the final length.
+    Tuple[Union[Dict[str, List[Any]], np.ndarray], int, int]
+        A tuple containing the truncated cycle values (as dictionary or 2-D array, like
+        the provided values), the initial length, and the final length. Arrays are
+        truncated to views, without copying the values, and values that are not longer
+        than the target length are returned unchanged (the same object).
 
     Examples
     --------
@@ -36,29 +42,31 @@ def apply_truncating(
     >>> print(truncated_values)
     >>> print(f"Initial length: {initial_len}, Final length: {final_len}")
     """
-
     # Determine the initial length of the cycle values
-    initial_length = len(next(iter(cycle_values.values())))
+    if isinstance(cycle_values, np.ndarray):
+        initial_length = cycle_values.shape[1]
+    else:
+        initial_length = len(next(iter(cycle_values.values())))
 
-    # Function to truncate a sequence based on the target length and cutoff position
-    def truncate_sequence(
-        seq: List[Any], target_length: int, cutoff_position: str
-    ) -> List[Any]:
-        if cutoff_position == "pre":
-            # If the cutoff position is 'pre', retain the last 'target_length' elements
-            return seq[-target_length:]
-        else:
-            # Otherwise, retain the first 'target_length' elements
-            return seq[:target_length]
+    # Values that are not longer than the target length are returned as they are
+    if initial_length <= target_length:
+        return cycle_values, initial_length, initial_length
 
-    # Apply truncating to each value type in the cycle values
-    truncated_sequences = {
-        k: truncate_sequence(v, target_length, cutoff_position)
-        for k, v in cycle_values.items()
-    }
+    # Get the slice to retain once for all value types
+    if cutoff_position == "pre":
+        # If the cutoff position is 'pre', retain the last 'target_length' elements
+        kept = slice(max(initial_length - target_length, 0), None)
+    else:
+        # Otherwise, retain the first 'target_length' elements
+        kept = slice(0, target_length)
 
-    # Determine the final length of the truncated cycle values
-    final_length = len(next(iter(truncated_sequences.values())))
+    # Apply truncating to all value types (a single slice of all rows for an array)
+    if isinstance(cycle_values, np.ndarray):
+        truncated_sequences = cycle_values[:, kept]
+        final_length = truncated_sequences.shape[1]
+    else:
+        truncated_sequences = {k: v[kept] for k, v in cycle_values.items()}
+        final_length = len(next(iter(truncated_sequences.values())))
 
     # Return the truncated cycle values along with the initial and final lengths
     return truncated_sequences, initial_length, final_length
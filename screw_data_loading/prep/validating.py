@@ -34,6 +34,8 @@ class ParameterNames:
     split_seed: str
     return_format: str
     result_format: str
+    return_lengths: str
+    cache_enabled: str
     logging_enabled: str
     verbose: str
 
@@ -53,11 +55,19 @@ PN = ParameterNames(
     "split_seed",
     "return_format",
     "result_format",
+    "return_lengths",
+    "cache_enabled",
     "logging_enabled",
     "verbose",
 )
 ALL = "all"
 
+# Define the valid selections (as frozensets for the membership checks)
+VALID_STEPS = frozenset(range(1, 5))  # valid steps are 1 through 4
+VALID_CYCLES = frozenset(range(1, 51))  # cycles from 1 to 50
+VALID_VALUES = ["time", "torque", "angle", "gradient"]  # in the order of "all"
+VALID_VALUES_SET = frozenset(VALID_VALUES)
+
 
 def validate_parameter(func):
     @wraps(func)
@@ -73,7 +83,7 @@ def validate_parameter(func):
         logging_enabled = params.get(PN.logging_enabled, True)
 
         if logging_enabled:
-            logger.info(f"Starting the parameter check with parameters: {params}")
+            logger.info("Starting the parameter check with parameters: %s", params)
 
         # Perform parameter validation and update
         validate_and_update_params(params)
@@ -88,39 +98,13 @@ def validate_parameter(func):
 def validate_and_update_params(params: Dict[str, Any]):
     """Validate and update parameters."""
     check_source_path(params.get(PN.source_path))
-    params[PN.tightening_steps] = check_and_update_steps(
-        params.get(PN.tightening_steps, ALL)
-    )
-    params[PN.tightening_cycles] = check_and_update_cycles(
-        params.get(PN.tightening_cycles, ALL)
-    )
-    params[PN.tightening_values] = check_and_update_values(
-        params.get(PN.tightening_values, ALL)
-    )
-    check_boolean_param(
-        params.get(PN.equidistancing_enabled, False), PN.equidistancing_enabled
-    )
+    for param_name, check_and_update in SELECTION_CHECKS:
+        params[param_name] = check_and_update(params.get(param_name, ALL))
+    for param_name, check, default, args in PARAMETER_CHECKS:
+        check(params.get(param_name, default), param_name, *args)
     check_equidistancing(
         params.get(PN.equidistancing_enabled, False), params.get(PN.tightening_values)
     )
-    check_positive_integer(params.get(PN.target_length), PN.target_length)
-    check_choice_param(
-        params.get(PN.cutoff_position), PN.cutoff_position, ["pre", "post"]
-    )
-    check_numeric_param(params.get(PN.padding_value), PN.padding_value)
-    check_choice_param(
-        params.get(PN.padding_position), PN.padding_position, ["pre", "post"]
-    )
-    check_split_ratio(params.get(PN.split_ratio))
-    check_integer_param(params.get(PN.split_seed), PN.split_seed)
-    check_choice_param(
-        params.get(PN.return_format), PN.return_format, ["nested_list", "numpy_array"]
-    )
-    check_choice_param(
-        params.get(PN.result_format), PN.result_format, ["binary", "raw"]
-    )
-    check_boolean_param(params.get(PN.logging_enabled, True), PN.logging_enabled)
-    check_boolean_param(params.get(PN.verbose, True), PN.verbose)
 
 
 def check_source_path(source_path: str):
@@ -133,19 +117,18 @@ def check_source_path(source_path: str):
 
 def check_and_update_steps(tightening_steps: Union[str, int, List[int]]) -> List[int]:
     """Check and update tightening steps."""
-    valid_steps = list(range(1, 5))  # valid steps are 1 through 4
     if tightening_steps == ALL:
-        return valid_steps
+        return sorted(VALID_STEPS)
     elif isinstance(tightening_steps, int):
-        if tightening_steps not in valid_steps:
+        if tightening_steps not in VALID_STEPS:
             handle_error(
                 f"Tightening_steps as int must be between 1 and 4, got {tightening_steps}."
             )
         return [tightening_steps]
     elif isinstance(tightening_steps, list):
-        if not all(isinstance(item, int) for item in tightening_steps) or not all(
-            item in valid_steps for item in tightening_steps
-        ):
+        if not all(
+            isinstance(item, int) for item in tightening_steps
+        ) or not VALID_STEPS.issuperset(tightening_steps):
             handle_error(
                 f"All items in tightening_steps must be integers between 1 and 4, got {tightening_steps}."
             )
@@ -158,19 +141,18 @@ def check_and_update_steps(tightening_steps: Union[str, int, List[int]]) -> List
 
 def check_and_update_cycles(tightening_cycles: Union[str, int, List[int]]) -> List[int]:
     """Check and update tightening cycles."""
-    valid_cycles = list(range(1, 51))  # cycles from 1 to 50
     if tightening_cycles == ALL:
-        return valid_cycles
+        return sorted(VALID_CYCLES)
     elif isinstance(tightening_cycles, int):
-        if tightening_cycles not in valid_cycles:
+        if tightening_cycles not in VALID_CYCLES:
             handle_error(
                 f"Tightening_cycles as int must be between 1 and 50, got {tightening_cycles}."
             )
         return [tightening_cycles]
     elif isinstance(tightening_cycles, list):
-        if not all(isinstance(item, int) for item in tightening_cycles) or not all(
-            item in valid_cycles for item in tightening_cycles
-        ):
+        if not all(
+            isinstance(item, int) for item in tightening_cycles
+        ) or not VALID_CYCLES.issuperset(tightening_cycles):
             handle_error(
                 f"All items in tightening_cycles must be integers between 1 and 50, got {tightening_cycles}."
             )
@@ -183,19 +165,19 @@ def check_and_update_cycles(tightening_cycles: Union[str, int, List[int]]) -> Li
 
 def check_and_update_values(tightening_values: Union[str, List[str]]) -> List[str]:
     """Check and update tightening values."""
-    valid_values = ["time", "torque", "angle", "gradient"]
+    valid_values = VALID_VALUES
     if tightening_values == ALL:
-        return valid_values
+        return list(valid_values)
     elif isinstance(tightening_values, str):
-        if tightening_values not in valid_values:
+        if tightening_values not in VALID_VALUES_SET:
             handle_error(
                 f"Tightening_values as str must be one of {valid_values}, got {tightening_values}"
             )
         return [tightening_values]
     elif isinstance(tightening_values, list):
-        if not all(isinstance(item, str) for item in tightening_values) or not all(
-            item in valid_values for item in tightening_values
-        ):
+        if not all(
+            isinstance(item, str) for item in tightening_values
+        ) or not VALID_VALUES_SET.issuperset(tightening_values):
             handle_error(
                 f"All items in tightening_values must be strings and one of {valid_values}, got {tightening_values}."
             )
@@ -248,13 +230,13 @@ def check_numeric_param(param: Any, param_name: str):
         )
 
 
-def check_split_ratio(split_ratio: Any):
+def check_split_ratio(split_ratio: Any, param_name: str = PN.split_ratio):
     """Check if the split ratio is valid."""
     if split_ratio is not None and (
         not isinstance(split_ratio, float) or not (0 < split_ratio < 1)
     ):
         handle_error(
-            f"Invalid split_ratio, expected a float between 0 and 1, got {split_ratio}."
+            f"Invalid {param_name}, expected a float between 0 and 1, got {split_ratio}."
         )
 
 
@@ -266,6 +248,31 @@ def check_integer_param(param: Any, param_name: str):
         )
 
 
+# Define the checks of the selections (which are updated to lists)
+SELECTION_CHECKS = (
+    (PN.tightening_steps, check_and_update_steps),
+    (PN.tightening_cycles, check_and_update_cycles),
+    (PN.tightening_values, check_and_update_values),
+)
+
+# Define the checks of all other parameters as (name, check, default, further args)
+PARAMETER_CHECKS = (
+    (PN.equidistancing_enabled, check_boolean_param, False, ()),
+    (PN.target_length, check_positive_integer, None, ()),
+    (PN.cutoff_position, check_choice_param, None, (["pre", "post"],)),
+    (PN.padding_value, check_numeric_param, None, ()),
+    (PN.padding_position, check_choice_param, None, (["pre", "post"],)),
+    (PN.split_ratio, check_split_ratio, None, ()),
+    (PN.split_seed, check_integer_param, None, ()),
+    (PN.return_format, check_choice_param, None, (["nested_list", "numpy_array"],)),
+    (PN.result_format, check_choice_param, None, (["binary", "raw"],)),
+    (PN.return_lengths, check_boolean_param, False, ()),
+    (PN.cache_enabled, check_boolean_param, False, ()),
+    (PN.logging_enabled, check_boolean_param, True, ()),
+    (PN.verbose, check_boolean_param, True, ()),
+)
+
+
 def handle_error(message: str):
     """Log and raise an error with a given message."""
     logger.error(message)
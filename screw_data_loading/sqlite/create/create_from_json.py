@@ -1,9 +1,35 @@
-import json
 import os
 import sqlite3
+from concurrent.futures import ProcessPoolExecutor
+from json import JSONDecodeError
+from pathlib import Path
 
+import numpy as np
+import orjson
 from tqdm import tqdm
 
+# Number of files parsed by a worker process at once (fewer, larger messages), whose rows
+# are then inserted with a single executemany per table
+CHUNK_SIZE = 64
+
+
+# Value lists in the graph of a step (in the order of the screw_steps columns) and the
+# data type they are stored in: the measurements as float32 (as returned by get_data),
+# the time in full precision (it defines the grid of the equidistancing)
+GRAPH_VALUES = {
+    "angle values": np.float32,
+    "torque values": np.float32,
+    "gradient values": np.float32,
+    "torqueRed values": np.float32,
+    "angleRed values": np.float32,
+    "time values": np.float64,
+}
+
+
+def to_json_text(value):
+    """Encode a value as JSON text (for the TEXT columns, orjson returns bytes)."""
+    return orjson.dumps(value).decode()
+
 
 def execute_script_from_file(filename, connection):
     with open(filename, "r") as file:
@@ -13,66 +39,71 @@ def execute_script_from_file(filename, connection):
     cursor.close()
 
 
-def insert_screw_run(cursor, screw_run_data, file_id):
-    """Insert a screw run into the screw_runs table."""
-    insert_query = """
-    INSERT INTO screw_runs (
-        id, 
-        format, 
-        node_id, 
-        nr, 
-        result, 
-        hardware, 
-        mac0, 
-        ip0, 
-        sw_version, 
-        sw_build,
-        MCE_transducer_function, 
-        MCE_measuring, 
-        MCE_factor, 
-        max_speed, 
-        location_name, 
-        channel,
-        prg_nr, 
-        prg_name, 
-        prg_date, 
-        cycle, 
-        redundancy_sensor, 
-        nominal_torque, 
-        date, 
-        id_code, 
-        torque_unit,
-        last_cmd, 
-        last_step_row, 
-        last_step_column, 
-        quality_code, 
-        total_time, 
-        tool_serial,
-        redundancy_transducer_serial, 
-        spindle_id, 
-        rework_code, 
-        rework_text, 
-        batch_nr, 
-        batch_canceled,
-        batch_direction_ok, 
-        batch_direction_nok, 
-        batch_max_ok, 
-        batch_ok,
-        batch_max_nok, 
-        batch_nok,
-        angle_global_threshold_nom, 
-        angle_global_threshold_act, 
-        torque_ct, 
-        torque_cred
-    ) VALUES (
-        ?, ?, ?, ?, ?, ?, ?, ?, ?, ?,
-        ?, ?, ?, ?, ?, ?, ?, ?, ?, ?,
-        ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, 
-        ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, 
-        ?, ?, ?, ?, ?, ?, ?
-        );
-    """
-    values = (
+INSERT_SCREW_RUN_QUERY = """
+INSERT INTO screw_runs (
+    id, 
+    format, 
+    node_id, 
+    nr, 
+    result, 
+    hardware, 
+    mac0, 
+    ip0, 
+    sw_version, 
+    sw_build,
+    MCE_transducer_function, 
+    MCE_measuring, 
+    MCE_factor, 
+    max_speed, 
+    location_name, 
+    channel,
+    prg_nr, 
+    prg_name, 
+    prg_date, 
+    cycle, 
+    redundancy_sensor, 
+    nominal_torque, 
+    date, 
+    id_code, 
+    torque_unit,
+    last_cmd, 
+    last_step_row, 
+    last_step_column, 
+    quality_code, 
+    total_time, 
+    tool_serial,
+    redundancy_transducer_serial, 
+    spindle_id, 
+    rework_code, 
+    rework_text, 
+    batch_nr, 
+    batch_canceled,
+    batch_direction_ok, 
+    batch_direction_nok, 
+    batch_max_ok, 
+    batch_ok,
+    batch_max_nok, 
+    batch_nok,
+    angle_global_threshold_nom, 
+    angle_global_threshold_act, 
+    torque_ct, 
+    torque_cred
+) VALUES (
+    ?, ?, ?, ?, ?, ?, ?, ?, ?, ?,
+    ?, ?, ?, ?, ?, ?, ?, ?, ?, ?,
+    ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, 
+    ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, 
+    ?, ?, ?, ?, ?, ?, ?
+    );
+"""
+
+
+def get_screw_run_values(screw_run_data, file_id):
+    """Get the values of a screw run for a row of the screw_runs table."""
+    # Nested values (looked up once for all of their columns)
+    mce = screw_run_data.get("MCE", [{}])[0]
+    angle_global_threshold = screw_run_data.get("angle global threshold", {})
+    return (
         # Unique identifier for the screw run, derived from the filename
         file_id,
         # Defines the origin of the tightening data
@@ -94,15 +125,15 @@ def insert_screw_run(cursor, screw_run_data, file_id):
         # Software build identifier
         screw_run_data.get("sw build"),
         # MCE transducer function
-        screw_run_data.get("MCE", [{}])[0].get("Transducer function"),
+        mce.get("Transducer function"),
         # MCE measuring method
-        screw_run_data.get("MCE", [{}])[0].get("measuring"),
+        mce.get("measuring"),
         # MCE factor
-        screw_run_data.get("MCE", [{}])[0].get("factor"),
+        mce.get("factor"),
         # Maximum speed of the screw run
         screw_run_data.get("max. speed"),
         # Location names where the process was executed (list)
-        json.dumps(screw_run_data.get("location name")),
+        to_json_text(screw_run_data.get("location name")),
         # Channel information
         screw_run_data.get("channel"),
         # Program number
@@ -160,55 +191,76 @@ def insert_screw_run(cursor, screw_run_data, file_id):
         # Total NOK batch count
         screw_run_data.get("batch NOK"),
         # Nominal angle global threshold
-        screw_run_data.get("angle global threshold", {}).get("nom"),
+        angle_global_threshold.get("nom"),
         # Actual angle global threshold
-        screw_run_data.get("angle global threshold", {}).get("act"),
+        angle_global_threshold.get("act"),
         # Torque CT value
         screw_run_data.get("Torque CT"),
         # Torque Cred value
         screw_run_data.get("Torque Cred"),
     )
-    try:
-        cursor.execute(insert_query, values)
-    except sqlite3.Error as e:
-        print(f"An error occurred while inserting screw run data: {e}")
+
+
+def insert_screw_run(cursor, screw_run_data, file_id):
+    """Insert a screw run into the screw_runs table."""
+    values = get_screw_run_values(screw_run_data, file_id)
+    insert_batch(cursor, INSERT_SCREW_RUN_QUERY, [values], "screw run")
     return file_id
 
 
-def insert_screw_steps(cursor, screw_run_id, steps):
-    """Insert all steps of a screw run into the screw_steps table."""
-    insert_query = """
-    INSERT INTO screw_steps (
-        id,
-        screw_run_id, 
-        step_number,
-        step_type, 
-        row, 
-        column, 
-        name, 
-        last_cmd, 
-        quality_code, 
-        speed,
-        category, 
-        docu_buffer, 
-        result, 
-        angle_threshold_nom, 
-        angle_threshold_act, 
-        tightening_functions,
-        torsion_release, 
-        angle_values, 
-        torque_values, 
-        gradient_values, 
-        torquered_values, 
-        anglered_values, 
-        time_values
-    ) VALUES (
-        ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, 
-        ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, 
-        ?, ?, ?);
+INSERT_SCREW_STEPS_QUERY = """
+INSERT INTO screw_steps (
+    id,
+    screw_run_id, 
+    step_number,
+    step_type, 
+    row, 
+    column, 
+    name, 
+    last_cmd, 
+    quality_code, 
+    speed,
+    category, 
+    docu_buffer, 
+    result, 
+    angle_threshold_nom, 
+    angle_threshold_act, 
+    tightening_functions,
+    torsion_release, 
+    angle_values, 
+    torque_values, 
+    gradient_values, 
+    torquered_values, 
+    anglered_values, 
+    time_values
+) VALUES (
+    ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, 
+    ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, 
+    ?, ?, ?);
+"""
+
+
+def to_blob(values, dtype):
+    """
+    Encode a list of graph values as the raw bytes of an array (for the BLOB columns).
+
+    The values are read back with `np.frombuffer(blob, dtype)` (see GRAPH_VALUES for the
+    data type of each column). Missing values are stored as NULL.
     """
+    if values is None:
+        return None
+    return np.asarray(values, dtype=dtype).tobytes()
+
+
+def get_screw_steps_values(screw_run_id, steps):
+    """Get the values of all steps of a screw run for rows of the screw_steps table."""
     values = []
-    for step_number, step in enumerate(steps, start=1):
+    for step_index, step in enumerate(steps):
+        graph = step.get("graph", {})
+        angle_threshold = step.get("angle threshold", {})
+        graph_blobs = [
+            to_blob(graph.get(value), dtype) for value, dtype in GRAPH_VALUES.items()
+        ]
         values.append(
             (
                 # Auto-incremented unique ID
@@ -216,7 +268,7 @@ def insert_screw_steps(cursor, screw_run_id, steps):
                 # Foreign key linking to the screw_run
                 screw_run_id,
                 # Step number (1, 2, 3, or 4)
-                step_number,
+                step_index + 1,
                 # Type of the step (e.g., standard)
                 step.get("step type"),
                 # Row number of the step
@@ -238,31 +290,71 @@ def insert_screw_steps(cursor, screw_run_id, steps):
                 # Result of the step (OK/NOK)
                 step.get("result"),
                 # Nominal angle threshold
-                step.get("angle threshold", {}).get("nom"),
+                angle_threshold.get("nom"),
                 # Actual angle threshold
-                step.get("angle threshold", {}).get("act"),
+                angle_threshold.get("act"),
                 # Nominal value of the tightening function torque
-                json.dumps(step.get("tightening functions", [{}])),
+                to_json_text(step.get("tightening functions", [{}])),
                 # Torsion release value if available
-                step.get("graph", {}).get("torsion release"),
-                # List of angle values in the graph
-                json.dumps(step.get("graph", {}).get("angle values")),
-                # List of torque values in the graph
-                json.dumps(step.get("graph", {}).get("torque values")),
-                # List of gradient values in the graph
-                json.dumps(step.get("graph", {}).get("gradient values")),
-                # List of reduced torque values in the graph
-                json.dumps(step.get("graph", {}).get("torqueRed values")),
-                # List of reduced angle values in the graph
-                json.dumps(step.get("graph", {}).get("angleRed values")),
-                # List of time values in the graph
-                json.dumps(step.get("graph", {}).get("time values")),
+                graph.get("torsion release"),
+                # Arrays of angle, torque, gradient, reduced torque, reduced angle and
+                # time values in the graph (see GRAPH_VALUES and to_blob)
+                *graph_blobs,
             )
         )
+    return values
+
+
+def insert_screw_steps(cursor, screw_run_id, steps):
+    """Insert all steps of a screw run into the screw_steps table."""
+    values = get_screw_steps_values(screw_run_id, steps)
+    insert_batch(cursor, INSERT_SCREW_STEPS_QUERY, values, "screw step")
+
+
+def insert_batch(cursor, insert_query, values, table_name):
+    """
+    Insert the rows of several screw runs (or steps) with a single executemany.
+
+    If a row of the batch fails, the batch is rolled back (to a savepoint) and inserted
+    row by row instead, so that only the failing rows are skipped (as with single inserts).
+    """
+    cursor.execute("SAVEPOINT batch")
     try:
         cursor.executemany(insert_query, values)
-    except sqlite3.Error as e:
-        print(f"An error occurred while inserting screw step data: {e}")
+    except sqlite3.Error:
+        cursor.execute("ROLLBACK TO batch")
+        for row in values:
+            try:
+                cursor.execute(insert_query, row)
+            except sqlite3.Error as e:
+                print(f"An error occurred while inserting {table_name} data: {e}")
+    cursor.execute("RELEASE batch")
+
+
+def parse_json_file(file_path):
+    """
+    Read a JSON file and get the rows of its screw run and steps.
+
+    Returns None if the file cannot be decoded (the error is printed).
+    """
+    # Use the filename without extension as the ID
+    file_id = os.path.splitext(os.path.basename(file_path))[0]
+    json_bytes = Path(file_path).read_bytes()
+    try:
+        data = orjson.loads(json_bytes)
+    except JSONDecodeError as e:  # also catches orjson.JSONDecodeError (subclass)
+        print(f"An error occurred while reading {os.path.basename(file_path)}: {e}")
+        return None
+    steps = data.get("tightening steps", [])
+    return (
+        get_screw_run_values(data, file_id),
+        get_screw_steps_values(file_id, steps),
+    )
+
+
+def parse_json_files(file_paths):
+    """Parse a chunk of JSON files (in a worker process), see parse_json_file."""
+    return [parse_json_file(file_path) for file_path in file_paths]
 
 
 def main():
@@ -285,26 +377,45 @@ def main():
     else:
         print(f"Database {database_path} already exists. Skipping creation.")
 
-    conn = sqlite3.connect(database_path)
-    cursor = conn.cursor()
-
     json_files_path = "data/raw"
     if not os.path.exists(json_files_path):
         print(f"JSON files path {json_files_path} does not exist.")
         return
 
-    for json_file in tqdm(os.listdir(json_files_path)):
-        if json_file.endswith(".json"):
-            # Use the filename without extension as the ID
-            file_id = os.path.splitext(json_file)[0]
-            with open(os.path.join(json_files_path, json_file), "r") as f:
-                try:
-                    data = json.load(f)
-                except json.JSONDecodeError as e:
-                    print(f"An error occurred while reading {json_file}: {e}")
-                    continue
-                insert_screw_run(cursor, data, file_id)
-                insert_screw_steps(cursor, file_id, data.get("tightening steps", []))
+    conn = sqlite3.connect(database_path)
+    # Settings for the bulk load: no waiting for the disk after every write and the
+    # journal in memory (if the load is aborted, the database is created again anyway)
+    conn.execute("PRAGMA synchronous = OFF")
+    conn.execute("PRAGMA journal_mode = MEMORY")
+    conn.execute("PRAGMA temp_store = MEMORY")
+    conn.execute("PRAGMA cache_size = -200000")
+    cursor = conn.cursor()
+
+    # Parse the JSON files in chunks by several processes (decoding and encoding the
+    # values is CPU-bound), while only this process inserts the rows (the directory
+    # entries already carry the joined path and the file type, without a stat per file)
+    with os.scandir(json_files_path) as entries:
+        json_files = [
+            entry.path
+            for entry in entries
+            if entry.name.endswith(".json") and entry.is_file()
+        ]
+    chunks = [
+        json_files[i : i + CHUNK_SIZE] for i in range(0, len(json_files), CHUNK_SIZE)
+    ]
+
+    # Insert all files in a single transaction, the rows of every chunk as soon as it is
+    # received (so that the encoded graph values of a chunk are released right after its
+    # insert instead of being collected for a larger batch)
+    cursor.execute("BEGIN")
+    with ProcessPoolExecutor() as executor, tqdm(total=len(json_files)) as progress:
+        for parsed_files in executor.map(parse_json_files, chunks):
+            decoded_files = [parsed for parsed in parsed_files if parsed is not None]
+            runs_rows = [run_row for run_row, _ in decoded_files]
+            steps_rows = [row for _, step_rows in decoded_files for row in step_rows]
+            insert_batch(cursor, INSERT_SCREW_RUN_QUERY, runs_rows, "screw run")
+            insert_batch(cursor, INSERT_SCREW_STEPS_QUERY, steps_rows, "screw step")
+            progress.update(len(parsed_files))
 
     conn.commit()
     conn.close()
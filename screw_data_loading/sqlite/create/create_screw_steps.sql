@@ -19,11 +19,11 @@ CREATE TABLE IF NOT EXISTS screw_steps (
     tf_torque_act REAL,
     tightening_functions TEXT,
     torsion_release INTEGER,
-    angle_values TEXT,
-    torque_values TEXT,
-    gradient_values TEXT,
-    torquered_values TEXT,
-    anglered_values TEXT,
-    time_values TEXT,
+    angle_values BLOB,
+    torque_values BLOB,
+    gradient_values BLOB,
+    torquered_values BLOB,
+    anglered_values BLOB,
+    time_values BLOB,
     FOREIGN KEY (screw_run_id) REFERENCES screw_runs (id)
 );
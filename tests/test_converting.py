@@ -0,0 +1,54 @@
+# test_converting.py
+
+import unittest
+
+import numpy as np
+
+from screw_data_loading.prep import apply_conversion
+from screw_data_loading.prep.converting import convert_to_binary
+
+
+class TestConverting(unittest.TestCase):
+    def setUp(self):
+        self.results = ["OK", "NOK", "OK", "NOK"]
+
+    def test_convert_to_binary(self):
+        """
+        Test that "NOK" is converted to 1 and all other results to 0.
+        """
+        binary_data = convert_to_binary(self.results)
+
+        self.assertEqual(binary_data.dtype, np.int8)
+        np.testing.assert_array_equal(binary_data, [0, 1, 0, 1])
+
+    def test_apply_conversion_split_tuple(self):
+        """
+        Test the apply_conversion function with split data returned as tuple.
+        """
+        data = ([[1, 2]], [[3, 4]], self.results[:2], self.results[2:])
+        x_train, x_test, y_train, y_test = apply_conversion(
+            data, result_format="binary", return_format="nested_list"
+        )
+
+        self.assertEqual(x_train, [[1, 2]])
+        self.assertEqual(y_train, [0, 1])
+        self.assertEqual(y_test, [0, 1])
+
+    def test_apply_conversion_nested_list_arrays(self):
+        """
+        Test that arrays of the measurements are converted to (nested) lists.
+        """
+        x_values = [[np.array([1.0, 2.0]), np.array([3.0])], np.array([[4.0], [5.0]])]
+        x_values, y_values = apply_conversion(
+            [x_values, np.array([0, 1])],
+            result_format="raw",
+            return_format="nested_list",
+        )
+
+        self.assertEqual(x_values, [[[1.0, 2.0], [3.0]], [[4.0], [5.0]]])
+        self.assertEqual(y_values, [0, 1])
+        self.assertIsInstance(x_values[0][0][0], float)
+
+
+if __name__ == "__main__":
+    unittest.main()
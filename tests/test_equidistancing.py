@@ -5,6 +5,7 @@ import unittest
 import numpy as np
 
 from screw_data_loading.prep import apply_equidistancing
+from screw_data_loading.prep.equidistancing import get_time_grid
 
 
 class TestEquidistancing(unittest.TestCase):
@@ -57,6 +58,50 @@ class TestEquidistancing(unittest.TestCase):
         np.testing.assert_almost_equal(equidistant_values["time"], expected_time)
         np.testing.assert_almost_equal(equidistant_values["torque"], expected_torque)
 
+    def test_apply_equidistancing_duplicate_times(self):
+        """
+        Test that the values of duplicate times are averaged before the interpolation.
+        """
+        cycle_values = {
+            "time": [0.0, 0.1, 0.1, 0.2, 0.3],
+            "torque": [10, 20, 30, 40, 50],
+        }
+        equidistant_values, initial_len, final_len = apply_equidistancing(
+            cycle_values, self.interval_length
+        )
+
+        # Check the initial and final lengths
+        self.assertEqual(initial_len, 5)
+        self.assertEqual(final_len, 4)
+
+        # Check that the torque at the duplicate time is the mean of its values
+        np.testing.assert_almost_equal(equidistant_values["torque"], [10, 25, 40, 50])
+
+    def test_apply_equidistancing_float32(self):
+        """
+        Test the apply_equidistancing function with float32 as data type of the results.
+        """
+        equidistant_values, _, final_len = apply_equidistancing(
+            self.cycle_values, self.interval_length, dtype=np.float32
+        )
+
+        # Check the data types and that the time grid is unchanged
+        self.assertEqual(final_len, 4)
+        self.assertEqual(equidistant_values["time"].dtype, np.float32)
+        self.assertEqual(equidistant_values["torque"].dtype, np.float32)
+        np.testing.assert_allclose(equidistant_values["torque"], [10, 20, 30, 40])
+
+    def test_get_time_grid(self):
+        """
+        Test that the shared time grid matches np.arange for different starts and ends.
+        """
+        for start, end in [(0.0, 0.0), (0.0, 0.6), (0.0012, 1.2), (0.0, 0.31)]:
+            expected_grid = np.arange(start, end + 0.0012, 0.0012)
+            time_grid = get_time_grid(start, end, 0.0012)
+
+            np.testing.assert_array_equal(time_grid, expected_grid)
+            self.assertFalse(time_grid.flags.writeable)
+
 
 if __name__ == "__main__":
     unittest.main()
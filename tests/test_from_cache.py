@@ -0,0 +1,103 @@
+# test_from_cache.py
+
+import os
+import pickle
+import tempfile
+import unittest
+
+import numpy as np
+
+from screw_data_loading.load.from_cache import (
+    decode_data,
+    decode_runs,
+    encode_data,
+    encode_runs,
+    read_cache_file,
+    to_cache,
+)
+
+
+class TestFromCache(unittest.TestCase):
+    def setUp(self):
+        self.temp_dir = tempfile.TemporaryDirectory()
+        self.cache_path = os.path.join(self.temp_dir.name, "testset.0123.npz")
+
+    def tearDown(self):
+        self.temp_dir.cleanup()
+
+    def test_cache_data_round_trip(self):
+        """
+        Test that arrays and (ragged) nested lists are read back as they were written.
+        """
+        data = [
+            [[[1.0, 2.0], [3.0]], [[4.0], []]],
+            np.arange(6, dtype=np.float32).reshape(2, 3),
+            ["OK", "NOK"],
+            [0, 1],
+        ]
+        to_cache(self.cache_path, data)
+        cached_data = read_cache_file(self.cache_path, decode_data)
+
+        self.assertEqual(cached_data[0], data[0])
+        self.assertEqual(cached_data[1].dtype, np.float32)
+        np.testing.assert_array_equal(cached_data[1], data[1])
+        self.assertEqual(cached_data[2:], data[2:])
+        self.assertIsInstance(cached_data[3][0], int)
+
+    def test_cache_data_mixed_types(self):
+        """
+        Test that lists of values of mixed types are not encoded (and not cached).
+        """
+        self.assertIsNone(encode_data([[1, 2.0]]))
+        self.assertIsNone(encode_data([["OK", None]]))
+
+    def test_cache_runs_round_trip(self):
+        """
+        Test that the cached runs are decoded with the same values and data types.
+        """
+        runs = {
+            "a.json": (
+                10**18,
+                25000,
+                {
+                    "id code": "A",
+                    "result": "OK",
+                    "tightening steps": [
+                        {
+                            "graph": {
+                                "time values": np.array([0.0, 0.0012]),
+                                "torque values": np.array([1, 2], dtype=np.float32),
+                            }
+                        },
+                        {"graph": {}},
+                    ],
+                },
+            ),
+            "b.json": (10**18, 10, {"result": "NOK"}),
+        }
+        cached_runs = decode_runs(encode_runs(runs))
+
+        self.assertEqual(list(cached_runs), ["a.json", "b.json"])
+        self.assertEqual(cached_runs["b.json"], runs["b.json"])
+        mtime, size, run = cached_runs["a.json"]
+        self.assertEqual((mtime, size, run["id code"]), (10**18, 25000, "A"))
+        self.assertEqual(run["tightening steps"][1], {"graph": {}})
+        graph = run["tightening steps"][0]["graph"]
+        self.assertEqual(graph["time values"].dtype, np.float64)
+        self.assertEqual(graph["torque values"].dtype, np.float32)
+        np.testing.assert_array_equal(graph["time values"], [0.0, 0.0012])
+        np.testing.assert_array_equal(graph["torque values"], [1, 2])
+
+    def test_read_cache_file_pickle(self):
+        """
+        Test that a pickle file at the cache path is ignored instead of unpickled.
+        """
+        with open(self.cache_path, "wb") as cache_file:
+            pickle.dump([[1.0], ["OK"]], cache_file)
+
+        with self.assertLogs("screw_data_loading.load.from_cache", "WARNING"):
+            self.assertIsNone(read_cache_file(self.cache_path, decode_data))
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,86 @@
+# test_fused.py
+
+import unittest
+
+import numpy as np
+
+from screw_data_loading.prep import (
+    apply_equidistancing,
+    apply_padding,
+    apply_truncating,
+    build_cycle,
+)
+
+
+class TestFused(unittest.TestCase):
+    def setUp(self):
+        self.cycle_values = {
+            "time": np.array([0.0, 0.0024, 0.0024, 0.006, 0.0072]),
+            "torque": np.array([10, 20, 25, 30, 40]),
+        }
+        self.target_length = 8
+
+    def test_build_cycle_truncating(self):
+        """
+        Test that build_cycle matches equidistancing, truncating and padding in sequence.
+        """
+        for cutoff_pos in ["pre", "post"]:
+            values, _, _ = apply_equidistancing(self.cycle_values)
+            values, _, _ = apply_truncating(values, 5, cutoff_pos)
+            values, _, _ = apply_padding(values, 0, "pre", 5)
+
+            fused_values, lengths = build_cycle(
+                self.cycle_values,
+                target_length=5,
+                padding_val=0,
+                padding_pos="pre",
+                cutoff_pos=cutoff_pos,
+            )
+
+            self.assertEqual(lengths, (5, 7, 5, 5))
+            np.testing.assert_array_equal(fused_values["time"], values["time"])
+            np.testing.assert_array_equal(fused_values["torque"], values["torque"])
+
+    def test_build_cycle_padding(self):
+        """
+        Test build_cycle with padding to a target length longer than the values.
+        """
+        values, _, _ = apply_equidistancing(self.cycle_values)
+        values, _, _ = apply_padding(values, -1, "pre", self.target_length)
+
+        fused_values, lengths = build_cycle(
+            self.cycle_values,
+            target_length=self.target_length,
+            padding_val=-1,
+            padding_pos="pre",
+        )
+
+        self.assertEqual(lengths, (5, 7, 7, 8))
+        np.testing.assert_array_equal(fused_values["time"], values["time"])
+        np.testing.assert_array_equal(fused_values["torque"], values["torque"])
+
+    def test_build_cycle_out(self):
+        """
+        Test that build_cycle writes the padded values into the rows of a provided array.
+        """
+        values, _ = build_cycle(
+            self.cycle_values, self.target_length, padding_val=-1, padding_pos="post"
+        )
+        all_cycles = np.full((2, 3, self.target_length), np.nan)
+
+        fused_values, _ = build_cycle(
+            self.cycle_values,
+            self.target_length,
+            padding_val=-1,
+            padding_pos="post",
+            out=all_cycles[:, 1],
+        )
+
+        np.testing.assert_array_equal(all_cycles[0, 1], values["torque"])
+        np.testing.assert_array_equal(all_cycles[1, 1], values["time"])
+        self.assertTrue(np.shares_memory(fused_values["torque"], all_cycles))
+        self.assertTrue(np.isnan(all_cycles[:, [0, 2]]).all())
+
+
+if __name__ == "__main__":
+    unittest.main()
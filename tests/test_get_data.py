@@ -1,16 +1,23 @@
+import copy
+import glob
 import os
+import shutil
+import tempfile
 import unittest
+from contextlib import contextmanager
+from unittest import mock
 
 from screw_data_loading.get_data import get_data
 
 
 class TestGetData(unittest.TestCase):
-    def setUp(self):
-        self.test_data_dir = (
+    @classmethod
+    def setUpClass(cls):
+        cls.test_data_dir = (
             "./tests/data/"  # Update with the actual path to your test data directory
         )
-        self.default_params = {
-            "source_path": os.path.join(self.test_data_dir, "testset_01"),
+        cls.class_params = {
+            "source_path": os.path.join(cls.test_data_dir, "testset_01"),
             "tightening_steps": "all",
             "tightening_cycles": [1, 2, 3, 4],
             "tightening_values": ["time", "torque"],
@@ -27,13 +34,20 @@ class TestGetData(unittest.TestCase):
             "verbose": True,
         }
 
+        # Load the data with the default parameters once for all tests that use them
+        cls.default_result = get_data(**cls.class_params)
+
+    def setUp(self):
+        # Each test gets its own copy of the parameters to modify
+        self.default_params = copy.deepcopy(self.class_params)
+
     def test_get_data_directory(self):
         """
         Test get_data function with source_path as a directory.
         """
 
-        # Call the get_data function
-        result = get_data(**self.default_params)
+        # Use the result of the get_data function loaded in setUpClass
+        result = copy.deepcopy(self.default_result)
 
         # Check the return values (example checks, adjust according to your data)
         self.assertEqual(len(result), 4)  # x_train, x_test, y_train, y_test
@@ -55,8 +69,8 @@ class TestGetData(unittest.TestCase):
         Test get_data function with split_ratio defined.
         """
 
-        # Call the get_data function
-        result = get_data(**self.default_params)
+        # Use the result of the get_data function loaded in setUpClass
+        result = copy.deepcopy(self.default_result)
 
         # Check the return values (example checks, adjust according to your data)
         self.assertEqual(len(result), 4)  # x_train, x_test, y_train, y_test
@@ -91,6 +105,74 @@ class TestGetData(unittest.TestCase):
         for array in result:
             self.assertIsInstance(array, np.ndarray)
 
+    def test_get_data_directory_order(self):
+        """
+        Test that the result does not depend on the order the files are listed in.
+        """
+        import numpy as np
+
+        params = self.default_params.copy()
+        params["return_format"] = "numpy_array"
+        params["tightening_cycles"] = [1]
+        scandir = os.scandir
+
+        @contextmanager
+        def reversed_scandir(path):
+            with scandir(path) as entries:
+                yield reversed(list(entries))
+
+        # Call the get_data function with the files listed in both orders
+        result = get_data(**params)
+        with mock.patch("os.scandir", reversed_scandir):
+            reversed_result = get_data(**params)
+
+        for array, reversed_array in zip(result, reversed_result):
+            np.testing.assert_array_equal(array, reversed_array)
+
+    def test_get_data_return_lengths(self):
+        """
+        Test get_data function with return_lengths enabled.
+        """
+        params = self.default_params.copy()
+        params["return_lengths"] = True
+        params["padding_value"] = -1
+
+        # Call the get_data function
+        x_train, x_test, y_train, y_test, lengths_train, lengths_test = get_data(
+            **params
+        )
+
+        # Check that the lengths count the values that are not padded (padded "pre")
+        self.assertEqual(len(lengths_train), len(y_train))
+        self.assertEqual(len(lengths_test), len(y_test))
+        for torque, length in zip(x_train[1], lengths_train):
+            self.assertEqual(torque[: len(torque) - length], [-1] * (800 - length))
+
+    def test_get_data_cache(self):
+        """
+        Test get_data function with cache_enabled, using a copy of some test files.
+        """
+        source_path = self.default_params["source_path"]
+        with tempfile.TemporaryDirectory() as temp_dir:
+            params = self.default_params.copy()
+            params["source_path"] = os.path.join(temp_dir, "testset")
+            os.mkdir(params["source_path"])
+            for file_name in sorted(os.listdir(source_path))[:10]:
+                shutil.copy(os.path.join(source_path, file_name), params["source_path"])
+            params["cache_enabled"] = True
+
+            # The first call writes the cache files (of the data and the decoded files),
+            # the second call loads from it
+            result = get_data(**params)
+            self.assertEqual(len(glob.glob(os.path.join(temp_dir, "*.npz"))), 2)
+            self.assertEqual(get_data(**params), result)
+
+            # Other parameters load the data from the cached files (same values)
+            params["target_length"] = 700
+            cached_result = get_data(**params)
+            params["cache_enabled"] = False
+            self.assertEqual(cached_result, get_data(**params))
+
 
 if __name__ == "__main__":
     unittest.main()
@@ -0,0 +1,151 @@
+# test_get_dict_from_json.py
+
+import os
+import tempfile
+import threading
+import unittest
+
+from screw_data_loading.json.get_dict_from_json import (
+    MMAP_THRESHOLD,
+    clear_json_cache,
+    get_dict_from_json,
+)
+
+
+class TestGetDictFromJson(unittest.TestCase):
+    def setUp(self):
+        self.temp_dir = tempfile.TemporaryDirectory()
+        self.file_path = self.temp_dir.name
+        self.file_name = "test.json"
+        self.write_json('{"result": "OK"}')
+        clear_json_cache()
+
+    def tearDown(self):
+        clear_json_cache()
+        self.temp_dir.cleanup()
+
+    def write_json(self, content: str, mtime_ns: int = 10**18):
+        """Write the JSON content with a fixed modification time."""
+        json_file_path = os.path.join(self.file_path, self.file_name)
+        with open(json_file_path, "w") as json_file:
+            json_file.write(content)
+        os.utime(json_file_path, ns=(mtime_ns, mtime_ns))
+
+    def test_get_dict_from_json_cached(self):
+        """
+        Test that loading an unchanged file again returns a copy of the cached dict.
+        """
+        first = get_dict_from_json(self.file_path, self.file_name)
+        # Changing the file without changing its mtime and size keeps the cached dict
+        self.write_json('{"result": "NO"}')
+        second = get_dict_from_json(self.file_path, self.file_name)
+
+        self.assertEqual(first, {"result": "OK"})
+        self.assertEqual(second, {"result": "OK"})
+        self.assertIsNot(first, second)
+
+    def test_get_dict_from_json_modified_result(self):
+        """
+        Test that modifying a returned dict does not change later results.
+        """
+        self.write_json(
+            '{"result": "OK", "tightening steps": [{"graph": {"torque values": [1, 2]}}]}'
+        )
+        first = get_dict_from_json(self.file_path, self.file_name)
+        first["result"] = "NOK"
+        first["tightening steps"][0]["graph"]["torque values"].append(3)
+        first["tightening steps"][0]["graph"].pop("torque values")
+
+        self.assertEqual(
+            get_dict_from_json(self.file_path, self.file_name),
+            {
+                "result": "OK",
+                "tightening steps": [{"graph": {"torque values": [1, 2]}}],
+            },
+        )
+
+    def test_get_dict_from_json_cache_disabled(self):
+        """
+        Test that a file is decoded again if the cache is disabled.
+        """
+        get_dict_from_json(self.file_path, self.file_name)
+        self.write_json('{"result": "NO"}')
+
+        self.assertEqual(
+            get_dict_from_json(self.file_path, self.file_name, cache_enabled=False),
+            {"result": "NO"},
+        )
+
+    def test_get_dict_from_json_changed_file(self):
+        """
+        Test that a changed file is decoded again instead of returned from the cache.
+        """
+        get_dict_from_json(self.file_path, self.file_name)
+        self.write_json('{"result": "NOK"}', mtime_ns=2 * 10**18)
+
+        self.assertEqual(
+            get_dict_from_json(self.file_path, self.file_name), {"result": "NOK"}
+        )
+
+    def test_get_dict_from_json_full_path(self):
+        """
+        Test that a full path to the file can be provided without a file name.
+        """
+        json_file_path = os.path.join(self.file_path, self.file_name)
+
+        self.assertEqual(get_dict_from_json(json_file_path), {"result": "OK"})
+
+    def test_get_dict_from_json_large_file(self):
+        """
+        Test that a file above the memory map threshold is decoded correctly.
+        """
+        values = list(range(MMAP_THRESHOLD // 4))
+        self.write_json('{"torque values": %s}' % values)
+
+        self.assertEqual(
+            get_dict_from_json(self.file_path, self.file_name),
+            {"torque values": values},
+        )
+
+    def test_get_dict_from_json_values(self):
+        """
+        Test that only the id code, result and selected graph values are kept.
+        """
+        self.write_json(
+            '{"id code": "A", "result": "OK", "prg name": "P", "tightening steps": ['
+            '{"name": "S", "graph": {"torque values": [1], "angle values": [2]}}]}'
+        )
+
+        self.assertEqual(
+            get_dict_from_json(self.file_path, self.file_name, ("torque values",)),
+            {
+                "id code": "A",
+                "result": "OK",
+                "tightening steps": [{"graph": {"torque values": [1]}}],
+            },
+        )
+        self.assertIn("prg name", get_dict_from_json(self.file_path, self.file_name))
+
+    @unittest.skipUnless(hasattr(os, "mkfifo"), "Named pipes are not supported.")
+    def test_get_dict_from_json_pipe(self):
+        """
+        Test that a JSON file provided through a named pipe is read until the end.
+        """
+        pipe_path = os.path.join(self.file_path, "pipe.json")
+        os.mkfifo(pipe_path)
+        values = list(range(MMAP_THRESHOLD // 4))
+
+        def write_pipe():
+            with open(pipe_path, "w") as pipe:
+                pipe.write('{"torque values": %s}' % values)
+
+        writer = threading.Thread(target=write_pipe)
+        writer.start()
+        json_dict = get_dict_from_json(pipe_path)
+        writer.join()
+
+        self.assertEqual(json_dict, {"torque values": values})
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -51,6 +51,58 @@ class TestPadding(unittest.TestCase):
         np.testing.assert_almost_equal(padded_values["time"], expected_time)
         np.testing.assert_almost_equal(padded_values["torque"], [10, 20, 30, 0, 0])
 
+    def test_apply_padding_float32(self):
+        """
+        Test padding with float32 as data type of the results.
+        """
+        padded_values, _, _ = apply_padding(
+            self.cycle_values,
+            self.padding_value,
+            "pre",
+            self.target_length,
+            dtype=np.float32,
+        )
+
+        # Check the data types of the padded values and the new time
+        self.assertEqual(padded_values["time"].dtype, np.float32)
+        self.assertEqual(padded_values["torque"].dtype, np.float32)
+        np.testing.assert_allclose(padded_values["torque"], [0, 0, 10, 20, 30])
+
+    def test_apply_padding_out(self):
+        """
+        Test padding into the rows of a provided array.
+        """
+        out = np.ones((2, 2, self.target_length), dtype=np.float32)
+        padded_values, _, _ = apply_padding(
+            self.cycle_values,
+            self.padding_value,
+            "post",
+            self.target_length,
+            out=out[:, 1],
+        )
+
+        # Check that the values (and the new time) are written into the provided rows
+        np.testing.assert_array_equal(out[1, 1], [10, 20, 30, 0, 0])
+        np.testing.assert_allclose(out[0, 1], np.arange(self.target_length) * 0.0012)
+        self.assertTrue(np.shares_memory(padded_values["torque"], out))
+
+    def test_apply_padding_array(self):
+        """
+        Test padding all rows of a 2-D array at once.
+        """
+        cycle_values = np.array([[1, 2, 3], [10, 20, 30]], dtype=np.float32)
+        for padding_pos, expected_values in [
+            ("pre", [[-1, -1, 1, 2, 3], [-1, -1, 10, 20, 30]]),
+            ("post", [[1, 2, 3, -1, -1], [10, 20, 30, -1, -1]]),
+        ]:
+            padded_values, initial_len, final_len = apply_padding(
+                cycle_values, -1, padding_pos, self.target_length, dtype=np.float32
+            )
+
+            self.assertEqual((initial_len, final_len), (3, 5))
+            self.assertEqual(padded_values.dtype, np.float32)
+            np.testing.assert_array_equal(padded_values, expected_values)
+
 
 if __name__ == "__main__":
     unittest.main()
@@ -0,0 +1,61 @@
+# test_screw_run.py
+
+import unittest
+
+import numpy as np
+
+from screw_data_loading.json.get_dict_from_json import clear_json_cache
+from screw_data_loading.json.screw_run import ScrewRun
+from screw_data_loading.json.screw_step import ScrewStep
+
+
+class TestScrewRun(unittest.TestCase):
+    def setUp(self):
+        self.file_path = "tests/data/testset_01"
+        self.file_name = "Ch_000001596334.json"
+        clear_json_cache()
+
+    def tearDown(self):
+        clear_json_cache()
+
+    def test_screw_run_values_reloaded(self):
+        """
+        Test that reading the values of a run does not remove them for later runs.
+        """
+        first = ScrewRun(name=self.file_name, path=self.file_path)
+        first_torque = first.get_run_values("torque values")
+        second = ScrewRun(name=self.file_name, path=self.file_path)
+        second_torque = second.get_run_values("torque values")
+
+        self.assertGreater(len(first_torque), 0)
+        np.testing.assert_array_equal(second_torque, first_torque)
+
+    def test_screw_step_values(self):
+        """
+        Test that the values of a step hold all graph values as float32 arrays.
+        """
+        screw_run = ScrewRun(name=self.file_name, path=self.file_path)
+        screw_step = screw_run.screw_steps[0]
+
+        self.assertEqual(screw_step.values["torque values"].dtype, np.float32)
+        np.testing.assert_array_equal(
+            screw_step.values["torque values"], screw_step.get_values("torque values")
+        )
+        with self.assertRaises(TypeError):
+            screw_step.values["torque values"] = None
+
+    def test_screw_step_raw_values_dropped(self):
+        """
+        Test that the raw values are dropped once converted, without changing the JSON dict.
+        """
+        step_dict = {"graph": {"torque values": [1.0, 2.0], "angle values": [3.0]}}
+        screw_step = ScrewStep(step_dict)
+        screw_step.get_values("torque values")
+
+        self.assertNotIn("torque values", screw_step._graph)
+        self.assertIn("angle values", screw_step._graph)
+        self.assertEqual(step_dict["graph"]["torque values"], [1.0, 2.0])
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -3,6 +3,8 @@
 import unittest
 from typing import List, Any
 
+import numpy as np
+
 from screw_data_loading.prep import apply_split
 
 
@@ -27,15 +29,16 @@ class TestSplitting(unittest.TestCase):
         self.assertEqual(len(y_test), 2)
 
         # Check the actual values to ensure they are split correctly
-        expected_x_train = [[4, 2, 3], [9, 7, 8]]
-        expected_x_test = [[5, 1], [10, 6]]
-        expected_y_train = [40, 20, 30]
-        expected_y_test = [50, 10]
+        expected_x_train = [[5, 3, 4], [10, 8, 9]]
+        expected_x_test = [[2, 1], [7, 6]]
+        expected_y_train = [50, 30, 40]
+        expected_y_test = [20, 10]
 
         self.assertEqual(x_train, expected_x_train)
         self.assertEqual(x_test, expected_x_test)
-        self.assertEqual(y_train, expected_y_train)
-        self.assertEqual(y_test, expected_y_test)
+        np.testing.assert_array_equal(y_train, np.array(expected_y_train))
+        np.testing.assert_array_equal(y_test, np.array(expected_y_test))
+        self.assertTrue(np.issubdtype(y_train.dtype, np.integer))
 
     def test_apply_split_no_seed(self):
         """
@@ -53,18 +56,18 @@ class TestSplitting(unittest.TestCase):
         """
         Test the apply_split function without a defined split ratio.
         """
-        x_values, y_values = apply_split(self.data, None)
+        x_values, y_values = apply_split(self.data, None, self.split_seed)
 
         # Check the lengths of the splits
         self.assertEqual(len(x_values[0]), 5)
         self.assertEqual(len(y_values), 5)
 
         # Check the actual values to ensure they are returned correctly
-        expected_x_values = [[4, 2, 3, 1, 5], [9, 7, 8, 6, 10]]
-        expected_y_values = [40, 20, 30, 10, 50]
+        expected_x_values = [[5, 3, 4, 2, 1], [10, 8, 9, 7, 6]]
+        expected_y_values = [50, 30, 40, 20, 10]
 
         self.assertEqual(x_values, expected_x_values)
-        self.assertEqual(y_values, expected_y_values)
+        np.testing.assert_array_equal(y_values, np.array(expected_y_values))
 
     def test_apply_split_empty_data(self):
         """
@@ -79,7 +82,37 @@ class TestSplitting(unittest.TestCase):
 
         # Check the actual values to ensure they are returned correctly
         self.assertEqual(x_values, [[]])
-        self.assertEqual(y_values, [])
+        self.assertEqual(y_values.tolist(), [])
+
+    def test_apply_split_arrays(self):
+        """
+        Test that measurement arrays of the same shape are split into a single array.
+        """
+        data = [np.array(values, dtype=np.float32) for values in self.data]
+        x_train, x_test, y_train, y_test = apply_split(
+            data, self.split_ratio, self.split_seed
+        )
+
+        self.assertEqual(x_train.shape, (2, 3))
+        self.assertEqual(x_train.dtype, np.float32)
+        np.testing.assert_array_equal(x_train, [[5, 3, 4], [10, 8, 9]])
+        np.testing.assert_array_equal(x_test, [[2, 1], [7, 6]])
+        np.testing.assert_array_equal(y_train, [50, 30, 40])
+        np.testing.assert_array_equal(y_test, [20, 10])
+
+    def test_apply_split_2d_array(self):
+        """
+        Test that data provided as a single 2-D array is split into arrays.
+        """
+        data = np.array(self.data)
+        x_train, x_test, y_train, y_test = apply_split(
+            data, self.split_ratio, self.split_seed
+        )
+
+        np.testing.assert_array_equal(x_train, [[5, 3, 4], [10, 8, 9]])
+        np.testing.assert_array_equal(x_test, [[2, 1], [7, 6]])
+        np.testing.assert_array_equal(y_train, [50, 30, 40])
+        np.testing.assert_array_equal(y_test, [20, 10])
 
 
 if __name__ == "__main__":
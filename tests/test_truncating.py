@@ -3,6 +3,8 @@
 import unittest
 from typing import Any, Dict, List
 
+import numpy as np
+
 from screw_data_loading.prep import apply_truncating
 
 
@@ -68,6 +70,22 @@ class TestTruncating(unittest.TestCase):
         expected_torque = [10, 20, 30, 40, 50]
         self.assertEqual(truncated_values["time"], expected_time)
         self.assertEqual(truncated_values["torque"], expected_torque)
+        self.assertIs(truncated_values, self.cycle_values)
+
+    def test_apply_truncating_array(self):
+        """
+        Test truncating of a 2-D array with one row per value type.
+        """
+        cycle_array = np.array(list(self.cycle_values.values()))
+        truncated_values, initial_len, final_len = apply_truncating(
+            cycle_array, self.target_length, "pre"
+        )
+
+        # Check the lengths and that the values are a view of the array
+        self.assertEqual(initial_len, 5)
+        self.assertEqual(final_len, 3)
+        np.testing.assert_array_equal(truncated_values, cycle_array[:, 2:])
+        self.assertTrue(np.shares_memory(truncated_values, cycle_array))
 
 
 if __name__ == "__main__":